@@ -2,9 +2,10 @@
 """Generate design tokens and API specs from captured artefacts."""
 from __future__ import annotations
 
-import json
+import functools
 from pathlib import Path
 
+import orjson
 import yaml
 from rich.console import Console
 
@@ -15,12 +16,36 @@ CAPTURE_ROOT = WORKSPACE / "captures"
 DESIGN_ROOT = WORKSPACE / "design-tokens"
 FIXTURE_ROOT = WORKSPACE / "fixtures"
 
+# libyaml-backed emitter when PyYAML was built with it; identical output.
+YAML_DUMPER = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+
 
 def ensure_dirs() -> None:
     for directory in (DESIGN_ROOT / "ios", DESIGN_ROOT / "android", FIXTURE_ROOT / "shared"):
         directory.mkdir(parents=True, exist_ok=True)
 
 
+@functools.lru_cache(maxsize=None)
+def read_json_cached(path_str: str, mtime_ns: int) -> dict:
+    # mtime_ns is part of the cache key so edited files are re-read
+    return orjson.loads(Path(path_str).read_bytes())
+
+
+def load_json(path: Path) -> dict:
+    return read_json_cached(str(path), path.stat().st_mtime_ns)
+
+
+def write_if_changed(path: Path, payload: bytes) -> bool:
+    # leave identical files (and their mtimes) alone; downstream steps key off mtime
+    try:
+        if path.stat().st_size == len(payload) and path.read_bytes() == payload:
+            return False
+    except FileNotFoundError:
+        pass
+    path.write_bytes(payload)
+    return True
+
+
 def synthesize_design_tokens(platform: str) -> None:
     ui_dir = CAPTURE_ROOT / platform / "ui"
     tokens_path = DESIGN_ROOT / platform / "tokens.json"
@@ -34,7 +59,7 @@ def synthesize_design_tokens(platform: str) -> None:
     layout_summary_path = ui_dir / "layout-summary.json"
     layout_payload = {}
     if layout_summary_path.exists():
-        layout_payload = json.loads(layout_summary_path.read_text(encoding="utf-8"))
+        layout_payload = load_json(layout_summary_path)
 
     metrics_map = layout_payload.get("screens", {}) if isinstance(layout_payload, dict) else {}
 
@@ -44,7 +69,7 @@ def synthesize_design_tokens(platform: str) -> None:
         run_id = latest_run_file.read_text(encoding="utf-8").strip()
         summary_path = ui_dir / run_id / "summary.json"
         if summary_path.exists():
-            run_summary = json.loads(summary_path.read_text(encoding="utf-8"))
+            run_summary = load_json(summary_path)
 
     screens: dict[str, dict] = {}
     for flow in run_summary.get("flows", []):
@@ -73,8 +98,10 @@ def synthesize_design_tokens(platform: str) -> None:
         "screens": screens,
     }
 
-    tokens_path.write_text(json.dumps(tokens_payload, indent=2), encoding="utf-8")
-    console.print(f"Wrote design tokens to {tokens_path}")
+    if write_if_changed(tokens_path, orjson.dumps(tokens_payload, option=orjson.OPT_INDENT_2)):
+        console.print(f"Wrote design tokens to {tokens_path}")
+    else:
+        console.print(f"Design tokens unchanged at {tokens_path}")
 
 
 def synthesize_api_spec() -> None:
@@ -92,8 +119,11 @@ def synthesize_api_spec() -> None:
         "info": {"title": "Cloned App API", "version": "0.0.1"},
         "x-captured-flows": flows,
     }
-    spec_path.write_text(yaml.safe_dump(spec, sort_keys=False), encoding="utf-8")
-    console.print(f"Wrote API skeleton to {spec_path}")
+    payload = yaml.dump(spec, Dumper=YAML_DUMPER, sort_keys=False).encode("utf-8")
+    if write_if_changed(spec_path, payload):
+        console.print(f"Wrote API skeleton to {spec_path}")
+    else:
+        console.print(f"API skeleton unchanged at {spec_path}")
 
 
 def main() -> None:
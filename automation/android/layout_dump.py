@@ -3,27 +3,44 @@
 from __future__ import annotations
 
 import argparse
-import json
+import hashlib
+import os
+import shutil
 import re
-from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
 from pathlib import Path
+from xml.etree.ElementTree import iterparse
 
-from lxml import etree
+import orjson
 from rich.console import Console
+from rich.progress import track
 
 console = Console()
 
+# Bump whenever the shape of parse_xml's result changes so stale cache entries are ignored.
+LAYOUT_CACHE_VERSION = 2
+
+WORKSPACE = Path(__file__).resolve().parents[2]
+# kept out of captures/ so security_audit doesn't list the sidecars as config files
+LAYOUT_CACHE_DIR = WORKSPACE / "reports" / "android" / ".layout_cache"
+
 BOUNDS_RE = re.compile(r"\[(?P<x1>\d+),(?P<y1>\d+)\]\[(?P<x2>\d+),(?P<y2>\d+)\]")
+BOUNDS_MATCH = BOUNDS_RE.match
+# shared by every unparseable frame; nothing mutates frame rects after parsing
+ZERO_BOUNDS = {"x": 0, "y": 0, "width": 0, "height": 0}
 
 
-def parse_bounds(bounds: str) -> dict[str, float]:
-    match = BOUNDS_RE.match(bounds)
-    if not match:
-        return {"x": 0.0, "y": 0.0, "width": 0.0, "height": 0.0}
-    x1 = float(match.group("x1"))
-    y1 = float(match.group("y1"))
-    x2 = float(match.group("x2"))
-    y2 = float(match.group("y2"))
+def parse_bounds(bounds: str) -> dict[str, int]:
+    # uiautomator always emits "[x1,y1][x2,y2]"; split it directly and keep
+    # the regex for anything unusual.
+    try:
+        x1, y1, x2, y2 = map(int, bounds[1:-1].replace("][", ",").split(","))
+    except ValueError:
+        match = BOUNDS_MATCH(bounds)
+        if match is None:
+            return ZERO_BOUNDS
+        x1, y1, x2, y2 = map(int, match.groups())
     return {
         "x": x1,
         "y": y1,
@@ -33,27 +50,42 @@ def parse_bounds(bounds: str) -> dict[str, float]:
 
 
 def parse_xml(xml_path: Path) -> dict:
-    tree = etree.parse(str(xml_path))
-    elements = tree.findall(".//node")
-    classes = Counter(elem.get("class") for elem in elements if elem.get("class"))
-    accessibility = [
-        {
-            "content_desc": elem.get("content-desc"),
-            "text": elem.get("text"),
-        }
-        for elem in elements
-        if elem.get("content-desc") or elem.get("text")
-    ]
+    classes: dict[str, int] = {}
+    accessibility = []
     frames = []
-    for elem in elements:
+    element_count = 0
+    # Stream the dump: read attributes on "start" to keep document order, then
+    # detach finished children on "end" so only the open ancestors stay alive.
+    open_elements = []
+    for event, elem in iterparse(str(xml_path), events=("start", "end")):
+        if event == "end":
+            open_elements.pop()
+            if open_elements:
+                del open_elements[-1][:]
+            continue
+        open_elements.append(elem)
+        if elem.tag != "node":
+            continue
+        element_count += 1
+        attrs = elem.attrib
+        cls = attrs.get("class")
+        if cls:
+            classes[cls] = classes.get(cls, 0) + 1
+        content_desc = attrs.get("content-desc")
+        text = attrs.get("text")
+        if content_desc or text:
+            accessibility.append({
+                "content_desc": content_desc,
+                "text": text,
+            })
         frames.append(
             {
-                "type": elem.get("class"),
-                "rect": parse_bounds(elem.get("bounds", "")),
+                "type": cls,
+                "rect": parse_bounds(attrs.get("bounds", "")),
             }
         )
     return {
-        "element_count": len(elements),
+        "element_count": element_count,
         "class_frequency": classes,
         "accessibility": accessibility,
         "frames": frames,
@@ -64,13 +96,32 @@ def normalise_summary(summary: dict[str, dict]) -> dict[str, dict]:
     return {
         screen: {
             "element_count": data["element_count"],
-            "class_frequency": dict(data["class_frequency"]),
+            "class_frequency": data["class_frequency"],
             "accessibility": data["accessibility"],
         }
         for screen, data in summary.items()
     }
 
 
+def scan_all_runs(base: Path) -> list[Path]:
+    # captures are laid out as <base>/<run>/<screen>/source.xml, so two scandir
+    # levels find every hierarchy without a recursive glob
+    sources: list[Path] = []
+    with os.scandir(base) as runs:
+        for run_entry in runs:
+            if not run_entry.is_dir():
+                continue
+            with os.scandir(run_entry.path) as screens:
+                for screen_entry in screens:
+                    if not screen_entry.is_dir():
+                        continue
+                    source = os.path.join(screen_entry.path, "source.xml")
+                    if os.path.isfile(source):
+                        sources.append(Path(source))
+    sources.sort()
+    return sources
+
+
 def gather_sources(base: Path, run: str | None) -> tuple[list[Path], str | None]:
     if not base.exists():
         return [], None
@@ -82,7 +133,7 @@ def gather_sources(base: Path, run: str | None) -> tuple[list[Path], str | None]
         console.print(f"[yellow]Run {run} not found; falling back to latest")
 
     if run == "all":
-        return sorted(base.rglob("source.xml")), None
+        return scan_all_runs(base), None
 
     latest_file = base / "latest-run.txt"
     if latest_file.exists():
@@ -107,12 +158,80 @@ def gather_sources(base: Path, run: str | None) -> tuple[list[Path], str | None]
     return [], None
 
 
-def summarise(sources: list[Path]) -> dict[str, dict]:
+def file_digest(path: Path) -> str:
+    digest = hashlib.blake2b()
+    with path.open("rb") as fh:
+        for chunk in iter(lambda: fh.read(1024 * 1024), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def parse_xml_cached(xml: Path, cache_dir: Path) -> dict:
+    st = xml.stat()
+    source = str(xml.resolve())
+    key = hashlib.blake2b(source.encode("utf-8"), digest_size=16).hexdigest()
+    cache_file = cache_dir / f"{key}.json"
+    entry: dict = {}
+    if cache_file.exists():
+        try:
+            entry = orjson.loads(cache_file.read_bytes())
+        except orjson.JSONDecodeError:
+            entry = {}
+    if entry.get("version") == LAYOUT_CACHE_VERSION:
+        if entry.get("mtime_ns") == st.st_mtime_ns and entry.get("size") == st.st_size:
+            return entry["result"]
+        digest = file_digest(xml)
+        if entry.get("digest") == digest:
+            entry.update(mtime_ns=st.st_mtime_ns, size=st.st_size)
+            cache_file.write_bytes(orjson.dumps(entry))
+            return entry["result"]
+    else:
+        digest = file_digest(xml)
+
+    result = parse_xml(xml)
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    entry = {
+        "version": LAYOUT_CACHE_VERSION,
+        "source": source,
+        "mtime_ns": st.st_mtime_ns,
+        "size": st.st_size,
+        "digest": digest,
+        "result": result,
+    }
+    cache_file.write_bytes(orjson.dumps(entry))
+    return result
+
+
+def prune_cache(cache_dir: Path) -> None:
+    # drop entries whose hierarchy was deleted, or written by an older cache version
+    try:
+        entries = list(os.scandir(cache_dir))
+    except FileNotFoundError:
+        return
+    for cache_entry in entries:
+        try:
+            source = orjson.loads(Path(cache_entry.path).read_bytes()).get("source")
+        except (OSError, orjson.JSONDecodeError):
+            source = None
+        if not source or not os.path.exists(source):
+            try:
+                os.remove(cache_entry.path)
+            except OSError:
+                pass
+
+
+def parse_source(xml: Path, cache_dir: Path | None) -> dict:
+    return parse_xml_cached(xml, cache_dir) if cache_dir else parse_xml(xml)
+
+
+def summarise(sources: list[Path], cache_dir: Path | None = None) -> dict[str, dict]:
     summary: dict[str, dict] = {}
-    for xml in sources:
-        screen = xml.parent.name
-        console.print(f"Processing {xml}")
-        summary[screen] = parse_xml(xml)
+    # each hierarchy is independent and parsing holds the GIL, so fan out to processes
+    with ProcessPoolExecutor(max_workers=max(1, min(len(sources), os.cpu_count() or 1))) as executor:
+        results = executor.map(parse_source, sources, repeat(cache_dir), chunksize=4)
+        progress = track(results, description="Parsing hierarchies", total=len(sources), console=console)
+        for result, xml in zip(progress, sources):
+            summary[xml.parent.name] = result
     return summary
 
 
@@ -130,15 +249,20 @@ def main() -> None:
     sources, run_id = gather_sources(input_dir, args.run)
     if not sources:
         console.print(f"[yellow]No UI hierarchies found in {input_dir}")
-        output_path.write_text(json.dumps({"run_id": run_id, "screens": {}}, indent=2), encoding="utf-8")
+        output_path.write_bytes(orjson.dumps({"run_id": run_id, "screens": {}}, option=orjson.OPT_INDENT_2))
         return
 
-    summary = summarise(sources)
+    # earlier versions kept the cache next to the output inside captures/
+    legacy_cache = output_path.parent.resolve() / ".layout_cache"
+    if legacy_cache != LAYOUT_CACHE_DIR:
+        shutil.rmtree(legacy_cache, ignore_errors=True)
+    summary = summarise(sources, cache_dir=LAYOUT_CACHE_DIR)
+    prune_cache(LAYOUT_CACHE_DIR)
     payload = {
         "run_id": run_id,
         "screens": normalise_summary(summary),
     }
-    output_path.write_text(json.dumps(payload, indent=2), encoding="utf-8")
+    output_path.write_bytes(orjson.dumps(payload, option=orjson.OPT_INDENT_2))
     console.print(f"Wrote layout summary for run '{run_id}' to {output_path}")
 
 
@@ -3,17 +3,59 @@
 from __future__ import annotations
 
 import argparse
-import json
+import ctypes
+import ctypes.util
+import fcntl
+import os
 import shutil
+import sys
 import tempfile
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from typing import Iterator
 
+import orjson
 from rich.console import Console
 
 console = Console()
 IMAGE_EXTS = {".png", ".jpg", ".jpeg", ".webp", ".gif"}
 FONT_EXTS = {".ttf", ".otf", ".ttc"}
 ANIMATION_EXTS = {".json", ".lottie"}
+STRING_EXTS = {".strings", ".json"}
+MANIFEST_CATEGORIES = ("images", "fonts", "animations", "strings", "databases", "other")
+# suffixes whose category does not depend on the directory they live in
+SUFFIX_CATEGORY = {
+    **dict.fromkeys(IMAGE_EXTS, "images"),
+    **dict.fromkeys(FONT_EXTS, "fonts"),
+    ".sqlite": "databases",
+    ".db": "databases",
+}
+# Copies block in the kernel with the GIL released, so oversubscribe the CPUs.
+COPY_WORKERS = min(32, (os.cpu_count() or 1) * 4)
+# _IOW(0x94, 9, int) from linux/fs.h
+FICLONE = 0x40049409
+LIBC = ctypes.CDLL(ctypes.util.find_library("c"), use_errno=True) if sys.platform == "darwin" else None
+
+
+def clone_file(src: str, dest: str) -> bool:
+    # metadata-only reflink on copy-on-write filesystems (APFS, btrfs, XFS)
+    if LIBC is not None:
+        return LIBC.clonefile(os.fsencode(src), os.fsencode(dest), 0) == 0
+    if sys.platform.startswith("linux"):
+        with open(src, "rb") as fsrc, open(dest, "wb") as fdst:
+            try:
+                fcntl.ioctl(fdst.fileno(), FICLONE, fsrc.fileno())
+                return True
+            except OSError:
+                return False
+    return False
+
+
+def fast_copy(src: str, dest: str) -> None:
+    # shutil.copyfile falls back to an in-kernel sendfile copy on Linux.
+    if not clone_file(src, dest):
+        shutil.copyfile(src, dest)
+    shutil.copystat(src, dest)
 
 
 def unzip_ipa(ipa_path: Path, target: Path) -> Path:
@@ -22,43 +64,86 @@ def unzip_ipa(ipa_path: Path, target: Path) -> Path:
     return payload_dir
 
 
+def empty_manifest() -> dict[str, dict[str, list]]:
+    # columnar: parallel path/size lists per category instead of one dict per file
+    return {category: {"paths": [], "sizes": []} for category in MANIFEST_CATEGORIES}
+
+
+def in_directory(rel: str, name: str) -> bool:
+    # substring check first so the split only happens for plausible matches
+    return name in rel and name in rel.split(os.sep)
+
+
+def categorise(rel: str) -> str:
+    suffix = os.path.splitext(rel)[1].lower()
+    category = SUFFIX_CATEGORY.get(suffix)
+    if category:
+        return category
+    if suffix in ANIMATION_EXTS and in_directory(rel, "lottie"):
+        return "animations"
+    if suffix in STRING_EXTS and in_directory(rel, "lproj"):
+        return "strings"
+    return "other"
+
+
+def iter_files(directory: str) -> Iterator[os.DirEntry]:
+    # DirEntry caches d_type and stat results, so each file costs at most one stat call
+    subdirs = []
+    with os.scandir(directory) as entries:
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                subdirs.append(entry.path)
+            elif entry.is_file():
+                yield entry
+    for subdir in subdirs:
+        yield from iter_files(subdir)
+
+
 def collect_files(app_dir: Path, output_dir: Path) -> dict:
-    manifest = {
-        "images": [],
-        "fonts": [],
-        "animations": [],
-        "strings": [],
-        "databases": [],
-        "other": [],
-    }
-    for file in app_dir.rglob("*"):
-        if not file.is_file():
+    manifest = empty_manifest()
+    base = str(app_dir)
+    prefix_len = len(base) + len(os.sep)
+    output_base = str(output_dir)
+    copies: list[tuple[str, str]] = []
+    parent_dirs: set[str] = set()
+    for entry in iter_files(base):
+        try:
+            size = entry.stat().st_size
+        except FileNotFoundError:
             continue
-        rel = file.relative_to(app_dir)
-        suffix = file.suffix.lower()
-        category = "other"
-        if suffix in IMAGE_EXTS:
-            category = "images"
-        elif suffix in FONT_EXTS:
-            category = "fonts"
-        elif suffix in ANIMATION_EXTS and "lottie" in rel.parts:
-            category = "animations"
-        elif suffix in {".strings", ".json"} and "lproj" in rel.parts:
-            category = "strings"
-        elif suffix in {".sqlite", ".db"}:
-            category = "databases"
-
-        dest = output_dir / category / rel
-        dest.parent.mkdir(parents=True, exist_ok=True)
-        shutil.copy2(file, dest)
-        manifest[category].append({
-            "path": str(rel),
-            "size": file.stat().st_size,
-        })
+        src = entry.path
+        rel = src[prefix_len:]
+        category = categorise(rel)
+
+        dest = os.path.join(output_base, category, rel)
+        parent_dirs.add(os.path.dirname(dest))
+        copies.append((src, dest))
+        columns = manifest[category]
+        columns["paths"].append(rel)
+        columns["sizes"].append(size)
+
+    for directory in parent_dirs:
+        os.makedirs(directory, exist_ok=True)
+    with ThreadPoolExecutor(max_workers=COPY_WORKERS) as executor:
+        list(executor.map(lambda pair: fast_copy(*pair), copies))
     return manifest
 
 
-def build_summary(manifest: dict[str, list[dict]]) -> dict:
+def write_manifest(manifest: dict[str, dict[str, list]], manifest_path: Path) -> None:
+    # manifest.json keeps its list-of-records shape on disk; emit it one
+    # category at a time so only that category's records exist as objects
+    with manifest_path.open("wb") as handle:
+        handle.write(b"{")
+        separator = b"\n  "
+        for category, columns in manifest.items():
+            records = [{"path": path, "size": size} for path, size in zip(columns["paths"], columns["sizes"])]
+            body = orjson.dumps(records, option=orjson.OPT_INDENT_2).replace(b"\n", b"\n  ")
+            handle.write(separator + orjson.dumps(category) + b": " + body)
+            separator = b",\n  "
+        handle.write(b"\n}")
+
+
+def build_summary(manifest: dict[str, dict[str, list]]) -> dict:
     summary = {
         "categories": {},
         "totals": {
@@ -67,13 +152,14 @@ def build_summary(manifest: dict[str, list[dict]]) -> dict:
         },
     }
 
-    for category, items in manifest.items():
-        count = len(items)
-        size = sum(item["size"] for item in items)
+    for category, columns in manifest.items():
+        paths = columns["paths"]
+        count = len(paths)
+        size = sum(columns["sizes"])
         summary["categories"][category] = {
             "count": count,
             "bytes": size,
-            "examples": [item["path"] for item in items[:5]],
+            "examples": paths[:5],
         }
         summary["totals"]["files"] += count
         summary["totals"]["bytes"] += size
@@ -91,15 +177,19 @@ def extract(app: Path, output: Path, report: Path | None = None) -> None:
         app_dir = unzip_ipa(app, tmp)
         manifest = collect_files(app_dir, output)
         manifest_path = output / "manifest.json"
-        manifest_path.write_text(json.dumps(manifest, indent=2), encoding="utf-8")
+        write_manifest(manifest, manifest_path)
         summary = build_summary(manifest)
         summary_path = output / "summary.json"
-        summary_path.write_text(json.dumps(summary, indent=2), encoding="utf-8")
+        summary_path.write_bytes(orjson.dumps(summary, option=orjson.OPT_INDENT_2))
         console.print(f"Wrote manifest {manifest_path}")
         if report:
             report.parent.mkdir(parents=True, exist_ok=True)
-            report.write_text(json.dumps(summary, indent=2), encoding="utf-8")
-            console.print(f"Wrote asset summary {report}")
+            payload = orjson.dumps(summary, option=orjson.OPT_INDENT_2)
+            if report.exists() and report.read_bytes() == payload:
+                console.print(f"Asset summary unchanged at {report}")
+            else:
+                report.write_bytes(payload)
+                console.print(f"Wrote asset summary {report}")
 
 
 def main() -> None:
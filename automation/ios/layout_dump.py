@@ -3,44 +3,104 @@
 from __future__ import annotations
 
 import argparse
-import json
-from collections import Counter
+import hashlib
+import os
+import shutil
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
 from pathlib import Path
+from typing import Callable, Iterator
 
+import orjson
 from lxml import etree
 from rich.console import Console
+from rich.progress import track
+
+try:
+    import pygixml
+except ImportError:  # pugixml bindings are optional; lxml streaming is the fallback
+    pygixml = None
 
 console = Console()
 
+# Bump whenever the shape of parse_xml's result changes so stale cache entries are ignored.
+LAYOUT_CACHE_VERSION = 3
+
+WORKSPACE = Path(__file__).resolve().parents[2]
+# kept out of captures/ so security_audit doesn't list the sidecars as config files
+LAYOUT_CACHE_DIR = WORKSPACE / "reports" / "ios" / ".layout_cache"
+
+
+ELEMENT_XPATH = "//*[starts-with(name(), 'XCUIElementType')]"
+
+
+def lxml_elements(xml_path: Path) -> Iterator[tuple[str, Callable]]:
+    # Stream the dump: read attributes on "start" to keep document order, then
+    # drop each subtree on "end" so memory stays bounded on huge hierarchies.
+    context = etree.iterparse(str(xml_path), events=("start", "end"), huge_tree=True)
+    for event, elem in context:
+        if event == "end":
+            elem.clear(keep_tail=True)
+            while elem.getprevious() is not None:
+                del elem.getparent()[0]
+            continue
+        tag = elem.tag
+        if tag.startswith("XCUIElementType"):
+            yield tag, elem.get
+
+
+def pugixml_elements(xml_path: Path) -> Iterator[tuple[str, Callable]]:
+    # pugixml keeps the DOM in compact C++ nodes and evaluates the XPath
+    # natively, so only matching elements ever surface as Python objects
+    doc = pygixml.parse_file(str(xml_path))
+    for match in doc.root.select_nodes(ELEMENT_XPATH):
+        node = match.node
+
+        def get(key: str, default=None, attribute=node.attribute):
+            attr = attribute(key)
+            # pugixml reports empty attributes as None where lxml gives ""
+            return (attr.value or "") if attr else default
+
+        yield node.name, get
+
 
 def parse_xml(xml_path: Path) -> dict:
-    tree = etree.parse(str(xml_path))
-    elements = tree.xpath("//*[starts-with(name(), 'XCUIElementType')]")
-    classes = Counter(elem.tag for elem in elements)
-    accessibility = [
-        {
-            "label": elem.get("label"),
-            "identifier": elem.get("identifier"),
-            "value": elem.get("value"),
-        }
-        for elem in elements
-        if elem.get("label") or elem.get("value")
-    ]
-    frames = []
-    for elem in elements:
-        frames.append(
-            {
-                "type": elem.tag,
-                "rect": {
-                    "x": float(elem.get("x", 0)),
-                    "y": float(elem.get("y", 0)),
-                    "width": float(elem.get("width", 0)),
-                    "height": float(elem.get("height", 0)),
-                },
-            }
-        )
+    classes: dict[str, int] = {}
+    accessibility = []
+    # frames are stored column-wise: one list per field instead of two dicts per element
+    frames: dict[str, list] = {"type": [], "x": [], "y": [], "width": [], "height": []}
+    # bind the per-element method lookups once; this loop runs for every node
+    add_type = frames["type"].append
+    add_x = frames["x"].append
+    add_y = frames["y"].append
+    add_width = frames["width"].append
+    add_height = frames["height"].append
+    add_accessibility = accessibility.append
+    class_count = classes.get
+    intern = sys.intern
+    element_count = 0
+    elements = pugixml_elements(xml_path) if pygixml is not None else lxml_elements(xml_path)
+    for tag, get in elements:
+        # a screen only uses a few dozen XCUIElementType names; share one string per name
+        tag = intern(tag)
+        element_count += 1
+        classes[tag] = class_count(tag, 0) + 1
+        label = get("label")
+        value = get("value")
+        if label or value:
+            add_accessibility({
+                "label": label,
+                "identifier": get("identifier"),
+                "value": value,
+            })
+        add_type(tag)
+        add_x(float(get("x", 0)))
+        add_y(float(get("y", 0)))
+        add_width(float(get("width", 0)))
+        add_height(float(get("height", 0)))
     return {
-        "element_count": len(elements),
+        "element_count": element_count,
         "class_frequency": classes,
         "accessibility": accessibility,
         "frames": frames,
@@ -48,14 +108,14 @@ def parse_xml(xml_path: Path) -> dict:
 
 
 def normalise_summary(summary: dict[str, dict]) -> dict[str, dict]:
-    normalised: dict[str, dict] = {}
-    for screen, data in summary.items():
-        normalised[screen] = {
+    return {
+        screen: {
             "element_count": data["element_count"],
-            "class_frequency": dict(data["class_frequency"]),
+            "class_frequency": data["class_frequency"],
             "accessibility": data["accessibility"],
         }
-    return normalised
+        for screen, data in summary.items()
+    }
 
 
 def gather_sources(base: Path, run: str | None) -> tuple[list[Path], str | None]:
@@ -96,12 +156,80 @@ def gather_sources(base: Path, run: str | None) -> tuple[list[Path], str | None]
     return [], None
 
 
-def summarise(sources: list[Path]) -> dict[str, dict]:
+def file_digest(path: Path) -> str:
+    digest = hashlib.blake2b()
+    with path.open("rb") as fh:
+        for chunk in iter(lambda: fh.read(1024 * 1024), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def parse_xml_cached(xml: Path, cache_dir: Path) -> dict:
+    st = xml.stat()
+    source = str(xml.resolve())
+    key = hashlib.blake2b(source.encode("utf-8"), digest_size=16).hexdigest()
+    cache_file = cache_dir / f"{key}.json"
+    entry: dict = {}
+    if cache_file.exists():
+        try:
+            entry = orjson.loads(cache_file.read_bytes())
+        except orjson.JSONDecodeError:
+            entry = {}
+    if entry.get("version") == LAYOUT_CACHE_VERSION:
+        if entry.get("mtime_ns") == st.st_mtime_ns and entry.get("size") == st.st_size:
+            return entry["result"]
+        digest = file_digest(xml)
+        if entry.get("digest") == digest:
+            entry.update(mtime_ns=st.st_mtime_ns, size=st.st_size)
+            cache_file.write_bytes(orjson.dumps(entry))
+            return entry["result"]
+    else:
+        digest = file_digest(xml)
+
+    result = parse_xml(xml)
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    entry = {
+        "version": LAYOUT_CACHE_VERSION,
+        "source": source,
+        "mtime_ns": st.st_mtime_ns,
+        "size": st.st_size,
+        "digest": digest,
+        "result": result,
+    }
+    cache_file.write_bytes(orjson.dumps(entry))
+    return result
+
+
+def prune_cache(cache_dir: Path) -> None:
+    # drop entries whose hierarchy was deleted, or written by an older cache version
+    try:
+        entries = list(os.scandir(cache_dir))
+    except FileNotFoundError:
+        return
+    for cache_entry in entries:
+        try:
+            source = orjson.loads(Path(cache_entry.path).read_bytes()).get("source")
+        except (OSError, orjson.JSONDecodeError):
+            source = None
+        if not source or not os.path.exists(source):
+            try:
+                os.remove(cache_entry.path)
+            except OSError:
+                pass
+
+
+def parse_source(xml: Path, cache_dir: Path | None) -> dict:
+    return parse_xml_cached(xml, cache_dir) if cache_dir else parse_xml(xml)
+
+
+def summarise(sources: list[Path], cache_dir: Path | None = None) -> dict[str, dict]:
     summary: dict[str, dict] = {}
-    for xml in sources:
-        screen = xml.parent.name
-        console.print(f"Processing {xml}")
-        summary[screen] = parse_xml(xml)
+    # each hierarchy is independent and parsing holds the GIL, so fan out to processes
+    with ProcessPoolExecutor(max_workers=max(1, min(len(sources), os.cpu_count() or 1))) as executor:
+        results = executor.map(parse_source, sources, repeat(cache_dir), chunksize=4)
+        progress = track(results, description="Parsing hierarchies", total=len(sources), console=console)
+        for result, xml in zip(progress, sources):
+            summary[xml.parent.name] = result
     return summary
 
 
@@ -119,15 +247,20 @@ def main() -> None:
     sources, run_id = gather_sources(input_dir, args.run)
     if not sources:
         console.print(f"[yellow]No UI hierarchies found in {input_dir}")
-        output_path.write_text(json.dumps({"run_id": run_id, "screens": {}}, indent=2), encoding="utf-8")
+        output_path.write_bytes(orjson.dumps({"run_id": run_id, "screens": {}}, option=orjson.OPT_INDENT_2))
         return
 
-    summary = summarise(sources)
+    # earlier versions kept the cache next to the output inside captures/
+    legacy_cache = output_path.parent.resolve() / ".layout_cache"
+    if legacy_cache != LAYOUT_CACHE_DIR:
+        shutil.rmtree(legacy_cache, ignore_errors=True)
+    summary = summarise(sources, cache_dir=LAYOUT_CACHE_DIR)
+    prune_cache(LAYOUT_CACHE_DIR)
     payload = {
         "run_id": run_id,
         "screens": normalise_summary(summary),
     }
-    output_path.write_text(json.dumps(payload, indent=2), encoding="utf-8")
+    output_path.write_bytes(orjson.dumps(payload, option=orjson.OPT_INDENT_2))
     console.print(f"Wrote layout summary for run '{run_id}' to {output_path}")
 
 
@@ -3,15 +3,35 @@
 from __future__ import annotations
 
 import argparse
+import asyncio
 import subprocess
 from pathlib import Path
 
+try:
+    from mitmproxy import options
+    from mitmproxy.tools.dump import DumpMaster
+except ImportError:  # mitmdump installed standalone (brew/pipx); shell out instead
+    DumpMaster = None
+
 WORKSPACE = Path(__file__).resolve().parents[2]
 ADDON = WORKSPACE / "automation" / "shared" / "mitm_summary.py"
 
 
+async def replay_capture(capture: Path, output: Path) -> None:
+    # same as `mitmdump -nr <capture> -s <addon> --set summary_output=<output>`,
+    # without paying interpreter start-up and mitmproxy imports per capture
+    opts = options.Options()
+    master = DumpMaster(opts, with_termlog=False, with_dumper=False)
+    opts.update(server=False, rfile=str(capture), scripts=[str(ADDON)])
+    opts.set(f"summary_output={output}", defer=True)
+    await master.run()
+
+
 def process_capture(capture: Path, output: Path) -> None:
     output.parent.mkdir(parents=True, exist_ok=True)
+    if DumpMaster is not None:
+        asyncio.run(replay_capture(capture, output))
+        return
     cmd = [
         "mitmdump",
         "-nr",
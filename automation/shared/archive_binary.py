@@ -4,20 +4,45 @@ from __future__ import annotations
 
 import argparse
 import hashlib
-import json
+import os
 from datetime import datetime, timezone
 from pathlib import Path
 
+import orjson
 from rich.console import Console
 
 console = Console()
 
+COPY_CHUNK = 4 * 1024 * 1024
 
-def sha256sum(path: Path) -> str:
+
+def copy_with_sha256(source: Path, dest: Path) -> str:
+    # hash while copying so the binary is only read once; a single reused
+    # buffer avoids allocating a new bytes object per chunk
     digest = hashlib.sha256()
-    with path.open("rb") as fh:
-        for chunk in iter(lambda: fh.read(1024 * 1024), b""):
+    buffer = bytearray(COPY_CHUNK)
+    view = memoryview(buffer)
+    with source.open("rb", buffering=0) as src, dest.open("wb") as dst:
+        while True:
+            read = src.readinto(buffer)
+            if not read:
+                break
+            chunk = view[:read]
             digest.update(chunk)
+            dst.write(chunk)
+    return digest.hexdigest()
+
+
+def sha256_file(path: Path) -> str:
+    digest = hashlib.sha256()
+    buffer = bytearray(COPY_CHUNK)
+    view = memoryview(buffer)
+    with path.open("rb", buffering=0) as src:
+        while True:
+            read = src.readinto(buffer)
+            if not read:
+                break
+            digest.update(view[:read])
     return digest.hexdigest()
 
 
@@ -30,8 +55,11 @@ def archive(
     metadata: dict | None = None,
 ) -> dict:
     binary = binary.resolve()
-    if not binary.exists():
-        raise FileNotFoundError(f"Binary not found: {binary}")
+    # one stat answers both the existence check and size_bytes
+    try:
+        binary_stat = binary.stat()
+    except FileNotFoundError:
+        raise FileNotFoundError(f"Binary not found: {binary}") from None
 
     timestamp = datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%SZ")
     version_segment = version or timestamp
@@ -39,15 +67,22 @@ def archive(
     dest_dir.mkdir(parents=True, exist_ok=True)
 
     dest_file = dest_dir / binary.name
-    console.print(f"Archiving {binary} -> {dest_file}")
+    if dest_file.exists() and os.path.samefile(binary, dest_file):
+        # re-archiving an already archived binary under the same version: opening the
+        # destination for writing would truncate the source before it is read
+        console.print(f"{binary} is already archived at {dest_file}; hashing in place")
+        sha256 = sha256_file(binary)
+    else:
+        console.print(f"Archiving {binary} -> {dest_file}")
+        sha256 = copy_with_sha256(binary, dest_file)
 
     data = {
         "platform": platform,
         "source_path": str(binary),
         "stored_path": str(dest_file),
         "filename": binary.name,
-        "size_bytes": binary.stat().st_size,
-        "sha256": sha256sum(binary),
+        "size_bytes": binary_stat.st_size,
+        "sha256": sha256,
         "archived_at": timestamp,
         "version": version_segment,
     }
@@ -56,9 +91,8 @@ def archive(
     if metadata:
         data.update(metadata)
 
-    dest_file.write_bytes(binary.read_bytes())
     metadata_path = dest_dir / "metadata.json"
-    metadata_path.write_text(json.dumps(data, indent=2), encoding="utf-8")
+    metadata_path.write_bytes(orjson.dumps(data, option=orjson.OPT_INDENT_2))
     console.print(f"Wrote metadata {metadata_path}")
     return data
 
@@ -75,7 +109,7 @@ def main() -> None:
 
     extra: dict | None = None
     if args.metadata:
-        extra = json.loads(args.metadata)
+        extra = orjson.loads(args.metadata)
 
     archive(
         platform=args.platform,
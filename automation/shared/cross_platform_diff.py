@@ -3,26 +3,29 @@
 from __future__ import annotations
 
 import argparse
-import json
 from pathlib import Path
 
+import orjson
 from rich.console import Console
 from rich.table import Table
 
+import report_cache
+
 console = Console()
 
 WORKSPACE = Path(__file__).resolve().parents[2]
 DESIGN_ROOT = WORKSPACE / "design-tokens"
 REPORT_ROOT = WORKSPACE / "reports"
+ISSUE_ORDER = {"missing_on_android": 0, "missing_on_ios": 1, "metrics_mismatch": 2}
 
 
 def load_json(path: Path) -> dict:
-    if not path.exists():
+    try:
+        return report_cache.load(path)
+    except FileNotFoundError:
         console.print(f"[yellow]Missing file: {path}")
         return {}
-    try:
-        return json.loads(path.read_text(encoding="utf-8"))
-    except json.JSONDecodeError:
+    except orjson.JSONDecodeError:
         console.print(f"[red]Invalid JSON: {path}")
         return {}
 
@@ -35,24 +38,20 @@ def compare_tokens() -> list[dict[str, str]]:
     android_screens = android_tokens.get("screens", {}) if isinstance(android_tokens, dict) else {}
 
     issues: list[dict[str, str]] = []
-    ios_only = sorted(set(ios_screens) - set(android_screens))
-    android_only = sorted(set(android_screens) - set(ios_screens))
-
-    for screen in ios_only:
+    for screen in ios_screens.keys() - android_screens.keys():
         issues.append({
             "type": "missing_on_android",
             "item": screen,
             "detail": "Screen captured on iOS but not Android",
         })
-    for screen in android_only:
+    for screen in android_screens.keys() - ios_screens.keys():
         issues.append({
             "type": "missing_on_ios",
             "item": screen,
             "detail": "Screen captured on Android but not iOS",
         })
 
-    shared = set(ios_screens) & set(android_screens)
-    for screen in sorted(shared):
+    for screen in ios_screens.keys() & android_screens.keys():
         ios_entry = ios_screens.get(screen) or {}
         android_entry = android_screens.get(screen) or {}
         ios_metrics = ios_entry.get("metrics") if isinstance(ios_entry, dict) else None
@@ -63,6 +62,8 @@ def compare_tokens() -> list[dict[str, str]]:
                 "item": screen,
                 "detail": "Layout metrics differ between platforms",
             })
+    # one sort over the findings instead of sorting every screen list up front
+    issues.sort(key=lambda issue: (ISSUE_ORDER[issue["type"]], issue["item"]))
     return issues
 
 
@@ -93,7 +94,7 @@ def write_report(findings: list[dict[str, str]], output: Path) -> None:
     console.print(table)
 
 
-def main() -> None:
+def main(argv: list[str] | None = None) -> None:
     parser = argparse.ArgumentParser(description="Compare iOS and Android artefacts for parity")
     parser.add_argument(
         "--report",
@@ -101,7 +102,7 @@ def main() -> None:
         type=Path,
         help="Output path for parity report",
     )
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
 
     findings = compare_tokens()
     write_report(findings, args.report)
@@ -3,9 +3,9 @@
 from __future__ import annotations
 
 import argparse
-import json
 from pathlib import Path
 
+import orjson
 from rich.console import Console
 from rich.table import Table
 
@@ -19,8 +19,8 @@ def load(path: Path) -> dict:
     if not path.exists():
         return {}
     try:
-        return json.loads(path.read_text(encoding="utf-8"))
-    except json.JSONDecodeError:
+        return orjson.loads(path.read_bytes())
+    except orjson.JSONDecodeError:
         return {}
 
 
@@ -28,15 +28,16 @@ def diff_platform(current: dict, previous: dict, platform: str) -> dict:
     cur = current.get("platforms", {}).get(platform, {})
     prev = previous.get("platforms", {}).get(platform, {})
 
-    cur_flows = {flow.get("slug", flow.get("name")): flow for flow in cur.get("flows", [])}
-    prev_flows = {flow.get("slug", flow.get("name")): flow for flow in prev.get("flows", [])}
+    # the name is only looked up when a flow has no slug key at all
+    cur_flows = {(flow["slug"] if "slug" in flow else flow.get("name")): flow for flow in cur.get("flows", ())}
+    prev_flows = {(flow["slug"] if "slug" in flow else flow.get("name")): flow for flow in prev.get("flows", ())}
 
-    new_flows = sorted(set(cur_flows) - set(prev_flows))
-    removed_flows = sorted(set(prev_flows) - set(cur_flows))
+    new_flows = sorted(cur_flows.keys() - prev_flows.keys())
+    removed_flows = sorted(prev_flows.keys() - cur_flows.keys())
     failing = [slug for slug, flow in cur_flows.items() if flow.get("status") != "passed"]
 
-    cur_endpoints = set(cur.get("endpoints", {}).keys())
-    prev_endpoints = set(prev.get("endpoints", {}).keys())
+    cur_endpoints = cur.get("endpoints", {}).keys()
+    prev_endpoints = prev.get("endpoints", {}).keys()
     new_endpoints = sorted(cur_endpoints - prev_endpoints)
     removed_endpoints = sorted(prev_endpoints - cur_endpoints)
 
@@ -84,7 +85,7 @@ def main() -> None:
     console.print(table)
 
     diff_path = DOCS / "release-diff.json"
-    diff_path.write_text(json.dumps({"results": results}, indent=2), encoding="utf-8")
+    diff_path.write_bytes(orjson.dumps({"results": results}, option=orjson.OPT_INDENT_2))
     console.print(f"Wrote diff {diff_path}")
 
 
@@ -3,20 +3,29 @@
 from __future__ import annotations
 
 import argparse
-import json
+import io
+import os
 import shutil
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
-from datetime import datetime
+from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any
 
+import orjson
 from rich.console import Console
 
+import report_cache
+
 console = Console()
 
 WORKSPACE = Path(__file__).resolve().parents[2]
 REPORT_ROOT = WORKSPACE / "reports"
 DESIGN_ROOT = WORKSPACE / "design-tokens"
+# Bump whenever the shape of a diff section changes so stale cache entries are ignored.
+DIFF_CACHE_VERSION = 1
+# shared read-only default for .get() chains; never mutate
+EMPTY: dict[str, Any] = {}
 
 
 @dataclass
@@ -26,61 +35,103 @@ class FilePair:
     description: str
 
 
-def load_json(path: Path | None) -> dict[str, Any]:
-    if not path or not path.exists():
+def load_json(path: Path | None, st: os.stat_result | None = None) -> dict[str, Any]:
+    if not path:
         return {}
     try:
-        return json.loads(path.read_text(encoding="utf-8"))
-    except json.JSONDecodeError:
+        return report_cache.load(path, st)
+    except FileNotFoundError:
+        return {}
+    except orjson.JSONDecodeError:
         console.print(f"[yellow]Unable to parse JSON from {path}")
         return {}
 
 
+def snapshot_path(path: Path, label: str) -> Path:
+    # network-summary.json -> network-summary.<label>.json
+    return path.parent / f"{path.stem}.{label}.json"
+
+
+def stat_or_none(path: Path | None) -> os.stat_result | None:
+    if path is None:
+        return None
+    try:
+        return path.stat()
+    except OSError:
+        return None
+
+
+def file_fingerprint(path: Path | None, st: os.stat_result | None) -> list | None:
+    if st is None:
+        return None
+    return [str(path), st.st_mtime_ns, st.st_size]
+
+
+def load_diff_cache(cache_path: Path) -> dict[str, Any]:
+    try:
+        cache = orjson.loads(cache_path.read_bytes())
+    except (FileNotFoundError, orjson.JSONDecodeError):
+        return {}
+    if not isinstance(cache, dict) or cache.get("version") != DIFF_CACHE_VERSION:
+        return {}
+    return cache.get("sections", {})
+
+
 def resolve_previous(path: Path, provided: Path | None = None, root: Path | None = None) -> Path | None:
     if provided:
         return provided
     if root:
         candidate = root / path.name
-        if candidate.exists():
+        if stat_or_none(candidate) is not None:
+            return candidate
+    # one directory listing answers both sibling lookups
+    try:
+        siblings = set(os.listdir(path.parent))
+    except FileNotFoundError:
+        return None
+    for label in ("prev", "baseline"):
+        candidate = snapshot_path(path, label)
+        if candidate.name in siblings:
             return candidate
-    prev_candidate = path.with_suffix(path.suffix.replace(".json", ".prev.json"))
-    if prev_candidate.exists():
-        return prev_candidate
-    baseline_candidate = path.with_suffix(path.suffix.replace(".json", ".baseline.json"))
-    if baseline_candidate.exists():
-        return baseline_candidate
     return None
 
 
 def diff_network(current: dict[str, Any], previous: dict[str, Any]) -> dict[str, Any]:
-    current_endpoints = current.get("endpoints", {}) or {}
-    previous_endpoints = previous.get("endpoints", {}) or {}
-    current_keys = set(current_endpoints.keys())
-    previous_keys = set(previous_endpoints.keys())
+    current_endpoints = current.get("endpoints") or EMPTY
+    previous_endpoints = previous.get("endpoints") or EMPTY
+    if current_endpoints == previous_endpoints:
+        # nothing changed: skip the sorted union walk entirely
+        count = len(current_endpoints)
+        return {
+            "added": [],
+            "removed": [],
+            "changed": [],
+            "totals": {"added": 0, "removed": 0, "changed": 0, "current": count, "previous": count},
+        }
 
     added = []
-    for key in sorted(current_keys - previous_keys):
-        entry = current_endpoints[key]
-        added.append({
-            "endpoint": key,
-            "hosts": entry.get("hosts", []),
-            "status_codes": entry.get("status_codes", {}),
-        })
-
     removed = []
-    for key in sorted(previous_keys - current_keys):
-        entry = previous_endpoints[key]
-        removed.append({
-            "endpoint": key,
-            "hosts": entry.get("hosts", []),
-            "status_codes": entry.get("status_codes", {}),
-        })
-
     changed = []
-    shared = current_keys & previous_keys
-    for key in sorted(shared):
-        current_entry = current_endpoints.get(key, {})
-        previous_entry = previous_endpoints.get(key, {})
+    # one sorted walk over the union keeps every list in key order
+    for key in sorted(current_endpoints.keys() | previous_endpoints.keys()):
+        if key not in previous_endpoints:
+            entry = current_endpoints[key]
+            added.append({
+                "endpoint": key,
+                "hosts": entry.get("hosts", []),
+                "status_codes": entry.get("status_codes", {}),
+            })
+            continue
+        if key not in current_endpoints:
+            entry = previous_endpoints[key]
+            removed.append({
+                "endpoint": key,
+                "hosts": entry.get("hosts", []),
+                "status_codes": entry.get("status_codes", {}),
+            })
+            continue
+        current_entry = current_endpoints[key]
+        previous_entry = previous_endpoints[key]
         delta: dict[str, Any] = {}
         for field in ("hosts", "status_codes"):
             if current_entry.get(field) != previous_entry.get(field):
@@ -106,33 +157,38 @@ def diff_network(current: dict[str, Any], previous: dict[str, Any]) -> dict[str,
 
 
 def diff_assets(current: dict[str, Any], previous: dict[str, Any]) -> dict[str, Any]:
-    current_categories = current.get("categories", {}) or {}
-    previous_categories = previous.get("categories", {}) or {}
-    current_keys = set(current_categories.keys())
-    previous_keys = set(previous_categories.keys())
+    current_categories = current.get("categories") or EMPTY
+    previous_categories = previous.get("categories") or EMPTY
+    if current_categories == previous_categories:
+        return {
+            "added": [],
+            "removed": [],
+            "changed": [],
+            "totals": {"current": current.get("totals", {}), "previous": previous.get("totals", {})},
+        }
 
     added = []
-    for key in sorted(current_keys - previous_keys):
-        entry = current_categories[key]
-        added.append({
-            "category": key,
-            "count": entry.get("count", 0),
-            "bytes": entry.get("bytes", 0),
-        })
-
     removed = []
-    for key in sorted(previous_keys - current_keys):
-        entry = previous_categories[key]
-        removed.append({
-            "category": key,
-            "count": entry.get("count", 0),
-            "bytes": entry.get("bytes", 0),
-        })
-
     changed = []
-    for key in sorted(current_keys & previous_keys):
-        current_entry = current_categories.get(key, {})
-        previous_entry = previous_categories.get(key, {})
+    for key in sorted(current_categories.keys() | previous_categories.keys()):
+        if key not in previous_categories:
+            entry = current_categories[key]
+            added.append({
+                "category": key,
+                "count": entry.get("count", 0),
+                "bytes": entry.get("bytes", 0),
+            })
+            continue
+        if key not in current_categories:
+            entry = previous_categories[key]
+            removed.append({
+                "category": key,
+                "count": entry.get("count", 0),
+                "bytes": entry.get("bytes", 0),
+            })
+            continue
+        current_entry = current_categories[key]
+        previous_entry = previous_categories[key]
         if (
             current_entry.get("count") != previous_entry.get("count")
             or current_entry.get("bytes") != previous_entry.get("bytes")
@@ -157,17 +213,24 @@ def diff_assets(current: dict[str, Any], previous: dict[str, Any]) -> dict[str,
 
 
 def diff_tokens(current: dict[str, Any], previous: dict[str, Any]) -> dict[str, Any]:
-    current_screens = current.get("screens", {}) or {}
-    previous_screens = previous.get("screens", {}) or {}
-    current_keys = set(current_screens.keys())
-    previous_keys = set(previous_screens.keys())
+    current_screens = current.get("screens") or EMPTY
+    previous_screens = previous.get("screens") or EMPTY
+    if current_screens == previous_screens:
+        count = len(current_screens)
+        return {"added": [], "removed": [], "changed": [], "totals": {"current": count, "previous": count}}
 
-    added = sorted(current_keys - previous_keys)
-    removed = sorted(previous_keys - current_keys)
+    added = []
+    removed = []
     changed = []
-    for key in sorted(current_keys & previous_keys):
-        current_entry = current_screens.get(key, {})
-        previous_entry = previous_screens.get(key, {})
+    for key in sorted(current_screens.keys() | previous_screens.keys()):
+        if key not in previous_screens:
+            added.append(key)
+            continue
+        if key not in current_screens:
+            removed.append(key)
+            continue
+        current_entry = current_screens[key]
+        previous_entry = previous_screens[key]
         metrics_delta = current_entry.get("metrics") != previous_entry.get("metrics")
         status_delta = current_entry.get("status") != previous_entry.get("status")
         if metrics_delta or status_delta:
@@ -190,24 +253,22 @@ def diff_tokens(current: dict[str, Any], previous: dict[str, Any]) -> dict[str,
 
 
 def risk_rating(diff_payload: dict[str, Any]) -> dict[str, Any]:
-    counts = []
+    aggregate = 0
     for section in ("network", "assets", "tokens"):
-        section_data = diff_payload.get(section, {})
+        section_data = diff_payload.get(section, EMPTY)
         if not isinstance(section_data, dict):
             continue
-        totals = section_data.get("totals", {})
+        totals = section_data.get("totals", EMPTY)
         if section == "assets":
-            current_total = totals.get("current", {}).get("files", 0)
-            previous_total = totals.get("previous", {}).get("files", 0)
-            delta = abs(current_total - previous_total)
+            current_total = totals.get("current", EMPTY).get("files", 0)
+            previous_total = totals.get("previous", EMPTY).get("files", 0)
+            aggregate += abs(current_total - previous_total)
         else:
-            delta = (
+            aggregate += (
                 totals.get("added", 0)
                 + totals.get("removed", 0)
                 + totals.get("changed", 0)
             )
-        counts.append(delta)
-    aggregate = sum(counts)
     if aggregate == 0:
         level = "low"
         label = "stable"
@@ -221,56 +282,55 @@ def risk_rating(diff_payload: dict[str, Any]) -> dict[str, Any]:
 
 
 def format_markdown(platform: str, diff_payload: dict[str, Any]) -> str:
-    network = diff_payload.get("network", {})
-    assets = diff_payload.get("assets", {})
-    tokens = diff_payload.get("tokens", {})
-    risk = diff_payload.get("risk", {})
+    network = diff_payload.get("network", EMPTY)
+    assets = diff_payload.get("assets", EMPTY)
+    tokens = diff_payload.get("tokens", EMPTY)
+    risk = diff_payload.get("risk", EMPTY)
 
-    lines = [f"# {platform.upper()} Diff Summary", ""]
+    buf = io.StringIO()
+    buf.write(f"# {platform.upper()} Diff Summary\n\n")
     if risk:
-        lines.append(f"- Risk: **{risk.get('label', 'n/a')}** (score {risk.get('score', 0)})")
+        buf.write(f"- Risk: **{risk.get('label', 'n/a')}** (score {risk.get('score', 0)})\n")
     if network:
-        totals = network.get("totals", {})
-        lines.extend(
-            [
-                "## Network",
-                f"- Added: {totals.get('added', 0)}",
-                f"- Removed: {totals.get('removed', 0)}",
-                f"- Changed: {totals.get('changed', 0)}",
-            ]
+        totals = network.get("totals", EMPTY)
+        buf.write(
+            "## Network\n"
+            f"- Added: {totals.get('added', 0)}\n"
+            f"- Removed: {totals.get('removed', 0)}\n"
+            f"- Changed: {totals.get('changed', 0)}\n"
         )
         for item in network.get("added", [])[:5]:
-            lines.append(f"  - ➕ {item['endpoint']}")
+            buf.write(f"  - ➕ {item['endpoint']}\n")
         for item in network.get("removed", [])[:5]:
-            lines.append(f"  - ➖ {item['endpoint']}")
+            buf.write(f"  - ➖ {item['endpoint']}\n")
     if assets:
-        totals = assets.get("totals", {})
-        lines.extend(
-            [
-                "## Assets",
-                f"- Current files: {totals.get('current', {}).get('files', 0)}",
-                f"- Previous files: {totals.get('previous', {}).get('files', 0)}",
-            ]
+        totals = assets.get("totals", EMPTY)
+        buf.write(
+            "## Assets\n"
+            f"- Current files: {totals.get('current', EMPTY).get('files', 0)}\n"
+            f"- Previous files: {totals.get('previous', EMPTY).get('files', 0)}\n"
         )
         for item in assets.get("changed", [])[:5]:
-            lines.append(
-                f"  - ∆ {item['category']}: {item['before'].get('count', 0)} → {item['after'].get('count', 0)}"
+            buf.write(
+                f"  - ∆ {item['category']}: {item['before'].get('count', 0)} → {item['after'].get('count', 0)}\n"
             )
     if tokens:
-        totals = tokens.get("totals", {})
-        lines.extend(
-            [
-                "## Design Tokens",
-                f"- Screens tracked: {totals.get('current', 0)}",
-                f"- Added screens: {len(tokens.get('added', []))}",
-                f"- Removed screens: {len(tokens.get('removed', []))}",
-            ]
+        totals = tokens.get("totals", EMPTY)
+        buf.write(
+            "## Design Tokens\n"
+            f"- Screens tracked: {totals.get('current', 0)}\n"
+            f"- Added screens: {len(tokens.get('added', []))}\n"
+            f"- Removed screens: {len(tokens.get('removed', []))}\n"
         )
         for screen in tokens.get("added", [])[:5]:
-            lines.append(f"  - ➕ {screen}")
+            buf.write(f"  - ➕ {screen}\n")
         for screen in tokens.get("removed", [])[:5]:
-            lines.append(f"  - ➖ {screen}")
-    return "\n".join(lines).strip() + "\n"
+            buf.write(f"  - ➖ {screen}\n")
+    return buf.getvalue().strip() + "\n"
+
+
+def utc_timestamp() -> str:
+    return datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%S.%fZ")
 
 
 def process_platform(
@@ -278,6 +338,7 @@ def process_platform(
     previous_root: Path | None,
     output_dir: Path | None,
     store_baseline: bool,
+    generated_at: str | None = None,
 ) -> dict[str, Any]:
     report_dir = REPORT_ROOT / platform
     tokens_path = DESIGN_ROOT / platform / "tokens.json"
@@ -302,25 +363,40 @@ def process_platform(
 
     payload: dict[str, Any] = {
         "platform": platform,
-        "generated_at": datetime.utcnow().isoformat() + "Z",
+        "generated_at": generated_at or utc_timestamp(),
     }
 
+    target_dir = output_dir or report_dir
+    # sections whose inputs are unchanged since the last run are reused as-is
+    cache_path = target_dir / ".diff-cache.json"
+    cached_sections = load_diff_cache(cache_path)
+    sections: dict[str, Any] = {}
+    # one stat per file feeds the fingerprint, the JSON load and the baseline copy
+    current_stats: dict[str, os.stat_result | None] = {}
     for pair in file_pairs:
-        current_data = load_json(pair.current)
-        previous_data = load_json(pair.previous)
-        if pair.description == "network":
-            payload["network"] = diff_network(current_data, previous_data)
-        elif pair.description == "assets":
-            payload["assets"] = diff_assets(current_data, previous_data)
+        current_st = current_stats[pair.description] = stat_or_none(pair.current)
+        previous_st = stat_or_none(pair.previous)
+        fingerprint = [file_fingerprint(pair.current, current_st), file_fingerprint(pair.previous, previous_st)]
+        cached = cached_sections.get(pair.description)
+        if isinstance(cached, dict) and cached.get("fingerprint") == fingerprint:
+            payload[pair.description] = cached["result"]
         else:
-            payload["tokens"] = diff_tokens(current_data, previous_data)
+            current_data = load_json(pair.current, current_st) if current_st else {}
+            previous_data = load_json(pair.previous, previous_st) if previous_st else {}
+            if pair.description == "network":
+                payload["network"] = diff_network(current_data, previous_data)
+            elif pair.description == "assets":
+                payload["assets"] = diff_assets(current_data, previous_data)
+            else:
+                payload["tokens"] = diff_tokens(current_data, previous_data)
+        sections[pair.description] = {"fingerprint": fingerprint, "result": payload[pair.description]}
 
     payload["risk"] = risk_rating(payload)
 
-    target_dir = output_dir or report_dir
     target_dir.mkdir(parents=True, exist_ok=True)
+    cache_path.write_bytes(orjson.dumps({"version": DIFF_CACHE_VERSION, "sections": sections}))
     json_path = target_dir / "diff-summary.json"
-    json_path.write_text(json.dumps(payload, indent=2), encoding="utf-8")
+    json_path.write_bytes(orjson.dumps(payload, option=orjson.OPT_INDENT_2))
     console.print(f"Wrote diff summary to {json_path}")
 
     markdown = format_markdown(platform, payload)
@@ -330,15 +406,15 @@ def process_platform(
 
     if store_baseline:
         for pair in file_pairs:
-            if not pair.current.exists():
+            if current_stats[pair.description] is None:
                 continue
-            baseline_path = pair.current.with_suffix(pair.current.suffix.replace(".json", ".prev.json"))
+            baseline_path = snapshot_path(pair.current, "prev")
             baseline_path.parent.mkdir(parents=True, exist_ok=True)
-            shutil.copy2(pair.current, baseline_path)
+            shutil.copyfile(pair.current, baseline_path)
     return payload
 
 
-def main() -> None:
+def main(argv: list[str] | None = None) -> None:
     parser = argparse.ArgumentParser(description="Diff artefacts between automation runs")
     parser.add_argument("platform", choices=["ios", "android", "both"], help="Platform to process")
     parser.add_argument(
@@ -356,22 +432,26 @@ def main() -> None:
         action="store_true",
         help="Copy current summaries to *.prev.json after diff completes",
     )
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
 
-    results = []
     platforms = [args.platform] if args.platform != "both" else ["ios", "android"]
-    for platform in platforms:
-        results.append(
-            process_platform(
-                platform,
-                previous_root=args.previous_root / platform if args.previous_root else None,
-                output_dir=args.output_dir / platform if args.output_dir else None,
-                store_baseline=args.store_baseline,
-            )
+    generated_at = utc_timestamp()
+
+    def run(platform: str) -> dict[str, Any]:
+        return process_platform(
+            platform,
+            previous_root=args.previous_root / platform if args.previous_root else None,
+            output_dir=args.output_dir / platform if args.output_dir else None,
+            store_baseline=args.store_baseline,
+            generated_at=generated_at,
         )
 
+    # platforms read and write disjoint files, so their I/O can overlap
+    with ThreadPoolExecutor(max_workers=len(platforms)) as executor:
+        results = list(executor.map(run, platforms))
+
     if len(results) == 2:
-        total_score = sum(item.get("risk", {}).get("score", 0) for item in results)
+        total_score = sum(item.get("risk", EMPTY).get("score", 0) for item in results)
         console.print(f"Aggregate diff score: {total_score}")
 
 
@@ -0,0 +1,21 @@
+#!/usr/bin/env python3
+"""Directory walking helpers shared by the reporting and audit scripts."""
+from __future__ import annotations
+
+import os
+from typing import Iterator
+
+
+def iter_files(directory: str) -> Iterator[os.DirEntry]:
+    # DirEntry caches d_type and stat results, so each file costs at most one stat call.
+    # Files are yielded in pre-order (a directory's files before its subdirectories),
+    # matching os.walk / rglob ordering.
+    subdirs = []
+    with os.scandir(directory) as entries:
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                subdirs.append(entry.path)
+            elif entry.is_file():
+                yield entry
+    for subdir in subdirs:
+        yield from iter_files(subdir)
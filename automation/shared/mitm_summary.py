@@ -1,14 +1,19 @@
 from __future__ import annotations
 
-import json
 from pathlib import Path
 
+import orjson
 from mitmproxy import ctx
 
 
 class SummaryAddon:
     def __init__(self) -> None:
-        self.records = []
+        self.path: Path | None = None
+        self.handle = None
+        self.written = 0
+        self.include_headers = True
+        self.max_body_bytes = 512
+        self.ndjson = False
 
     def load(self, loader) -> None:
         loader.add_option(
@@ -29,6 +34,39 @@ class SummaryAddon:
             512,
             "Trim bodies to this length for samples",
         )
+        loader.add_option(
+            "summary_ndjson",
+            bool,
+            False,
+            "Write one JSON record per line instead of a JSON array",
+        )
+
+    def configure(self, updates) -> None:
+        # cache option values once instead of resolving ctx.options per flow
+        self.include_headers = ctx.options.summary_include_headers
+        self.max_body_bytes = ctx.options.summary_max_body_bytes
+        self.ndjson = ctx.options.summary_ndjson
+
+    def open_output(self) -> None:
+        # options are only final once the addon is running, so open lazily
+        self.path = Path(ctx.options.summary_output or "network-summary.json")
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.handle = self.path.open("wb")
+        if not self.ndjson:
+            self.handle.write(b"[")
+
+    def write_record(self, record: dict) -> None:
+        # records go straight to disk so memory stays flat on long captures
+        if self.handle is None:
+            self.open_output()
+        if self.ndjson:
+            self.handle.write(orjson.dumps(record) + b"\n")
+        else:
+            # same layout as dumping the whole array with OPT_INDENT_2
+            separator = b",\n  " if self.written else b"\n  "
+            body = orjson.dumps(record, option=orjson.OPT_INDENT_2).replace(b"\n", b"\n  ")
+            self.handle.write(separator + body)
+        self.written += 1
 
     def response(self, flow) -> None:  # type: ignore[override]
         request = flow.request
@@ -48,16 +86,13 @@ class SummaryAddon:
             else None,
         }
 
-        if ctx.options.summary_include_headers:
-            record["request_headers"] = {
-                k: v for k, v in request.headers.items(multi=True)
-            }
+        if self.include_headers:
+            # [name, value] pairs keep repeated headers such as Set-Cookie
+            record["request_headers"] = list(request.headers.items(multi=True))
             if response:
-                record["response_headers"] = {
-                    k: v for k, v in response.headers.items(multi=True)
-                }
+                record["response_headers"] = list(response.headers.items(multi=True))
 
-        max_bytes = ctx.options.summary_max_body_bytes
+        max_bytes = self.max_body_bytes
         if request.content:
             record["request_body"] = request.content[:max_bytes].decode(
                 "utf-8", errors="replace"
@@ -67,15 +102,15 @@ class SummaryAddon:
                 "utf-8", errors="replace"
             )
 
-        self.records.append(record)
+        self.write_record(record)
 
     def done(self) -> None:
-        output_path = ctx.options.summary_output or "network-summary.json"
-        path = Path(output_path)
-        path.parent.mkdir(parents=True, exist_ok=True)
-        with path.open("w", encoding="utf-8") as fh:
-            json.dump(self.records, fh, indent=2)
-        ctx.log.info(f"Wrote summary to {path}")
+        if self.handle is None:
+            self.open_output()
+        if not self.ndjson:
+            self.handle.write(b"\n]" if self.written else b"]")
+        self.handle.close()
+        ctx.log.info(f"Wrote summary to {self.path}")
 
 
 addons = [SummaryAddon()]
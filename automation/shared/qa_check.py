@@ -3,12 +3,14 @@
 from __future__ import annotations
 
 import argparse
-import json
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 from rich.console import Console
 from rich.table import Table
 
+import report_cache
+
 console = Console()
 
 WORKSPACE = Path(__file__).resolve().parents[2]
@@ -17,32 +19,33 @@ REPORT_ROOT = WORKSPACE / "reports"
 
 
 def load_summary(platform: str) -> dict:
-    summary_path = REPORT_ROOT / platform / "ui-run.json"
-    if not summary_path.exists():
-        console.print(f"[yellow]{summary_path} missing")
+    try:
+        return report_cache.get(platform, "ui-run.json")
+    except FileNotFoundError:
+        console.print(f"[yellow]{REPORT_ROOT / platform / 'ui-run.json'} missing")
         return {}
-    return json.loads(summary_path.read_text(encoding="utf-8"))
 
 
 def check_flows(summary: dict) -> tuple[int, int]:
     flows = summary.get("flows", []) if summary else []
-    failed = [flow for flow in flows if flow.get("status") != "passed"]
-    return len(flows), len(failed)
+    failed = sum(1 for flow in flows if flow.get("status") != "passed")
+    return len(flows), failed
 
 
 def check_layout(summary_path: Path) -> int:
-    if not summary_path.exists():
+    try:
+        data = report_cache.load(summary_path)
+    except FileNotFoundError:
         return 0
-    data = json.loads(summary_path.read_text(encoding="utf-8"))
     screens = data.get("screens", {})
     return len(screens)
 
 
 def check_network(platform: str) -> int:
-    summary_path = REPORT_ROOT / platform / "network-summary.json"
-    if not summary_path.exists():
+    try:
+        data = report_cache.get(platform, "network-summary.json")
+    except FileNotFoundError:
         return 0
-    data = json.loads(summary_path.read_text(encoding="utf-8"))
     return len(data.get("endpoints", {}))
 
 
@@ -52,17 +55,6 @@ def qa_platform(platform: str) -> dict:
     layout_count = check_layout(REPORT_ROOT / platform / "layout-summary.json")
     endpoint_count = check_network(platform)
 
-    table = Table(title=f"QA Checks ({platform})")
-    table.add_column("Check")
-    table.add_column("Result")
-
-    table.add_row("Flows captured", str(flow_count))
-    table.add_row("Failed flows", str(failed))
-    table.add_row("Screens summarised", str(layout_count))
-    table.add_row("Endpoints captured", str(endpoint_count))
-
-    console.print(table)
-
     status = "passed"
     messages = []
     if flow_count == 0:
@@ -85,16 +77,30 @@ def qa_platform(platform: str) -> dict:
     }
 
 
-def main() -> None:
+def print_result(result: dict) -> None:
+    table = Table(title=f"QA Checks ({result['platform']})")
+    table.add_column("Check")
+    table.add_column("Result")
+
+    table.add_row("Flows captured", str(result["flow_count"]))
+    table.add_row("Failed flows", str(result["failed_flows"]))
+    table.add_row("Screens summarised", str(result["screens"]))
+    table.add_row("Endpoints captured", str(result["endpoints"]))
+
+    console.print(table)
+
+
+def main(argv: list[str] | None = None) -> None:
     parser = argparse.ArgumentParser(description="Run QA checks on capture artefacts")
     parser.add_argument("platform", choices=["ios", "android", "both"], help="Platform to inspect")
-    args = parser.parse_args()
-
-    results = []
-    if args.platform in ("ios", "both"):
-        results.append(qa_platform("ios"))
-    if args.platform in ("android", "both"):
-        results.append(qa_platform("android"))
+    args = parser.parse_args(argv)
+
+    platforms = [name for name in ("ios", "android") if args.platform in (name, "both")]
+    # load both platforms' reports concurrently, then print the tables in a stable order
+    with ThreadPoolExecutor(max_workers=len(platforms)) as executor:
+        results = list(executor.map(qa_platform, platforms))
+    for result in results:
+        print_result(result)
 
     overall = "passed" if all(r["status"] == "passed" for r in results) else "failed"
     console.print(f"[bold]{'QA passed' if overall == 'passed' else 'QA attention needed'}")
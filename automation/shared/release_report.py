@@ -3,12 +3,15 @@
 from __future__ import annotations
 
 import argparse
-import json
-from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
 from pathlib import Path
 
+import orjson
 from rich.console import Console
 
+import report_cache
+
 console = Console()
 
 WORKSPACE = Path(__file__).resolve().parents[2]
@@ -18,11 +21,9 @@ RELEASE_ROOT = WORKSPACE / "docs"
 
 
 def load_json(path: Path) -> dict:
-    if not path.exists():
-        return {}
     try:
-        return json.loads(path.read_text(encoding="utf-8"))
-    except json.JSONDecodeError:
+        return report_cache.load(path)
+    except (FileNotFoundError, orjson.JSONDecodeError):
         return {}
 
 
@@ -47,24 +48,25 @@ def generate(platform: str) -> dict:
 
 def write_report(data: dict, path: Path) -> None:
     path.parent.mkdir(parents=True, exist_ok=True)
-    path.write_text(json.dumps(data, indent=2), encoding="utf-8")
+    path.write_bytes(orjson.dumps(data, option=orjson.OPT_INDENT_2))
     console.print(f"Wrote release report {path}")
 
 
-def main() -> None:
+def main(argv: list[str] | None = None) -> None:
     parser = argparse.ArgumentParser(description="Generate release summary")
     parser.add_argument("platform", choices=["ios", "android", "both"], help="Platform to include")
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
 
     snapshot = {
-        "generated_at": datetime.utcnow().isoformat() + "Z",
+        "generated_at": datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%S.%fZ"),
         "platforms": {},
     }
 
-    if args.platform in ("ios", "both"):
-        snapshot["platforms"]["ios"] = generate("ios")
-    if args.platform in ("android", "both"):
-        snapshot["platforms"]["android"] = generate("android")
+    platforms = [name for name in ("ios", "android") if args.platform in (name, "both")]
+    # each platform only reads its own report directory, so load them concurrently
+    with ThreadPoolExecutor(max_workers=len(platforms)) as executor:
+        for platform, info in zip(platforms, executor.map(generate, platforms)):
+            snapshot["platforms"][platform] = info
 
     write_report(snapshot, RELEASE_ROOT / "release-summary.json")
 
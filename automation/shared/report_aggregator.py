@@ -3,15 +3,20 @@
 from __future__ import annotations
 
 import argparse
-import json
+import io
 import os
 import subprocess
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
 from typing import Any
 
+import orjson
 from rich.console import Console
 
+import report_cache
+from fs_walk import iter_files
+
 console = Console()
 
 WORKSPACE = Path(__file__).resolve().parents[2]
@@ -19,22 +24,66 @@ REPORT_ROOT = WORKSPACE / "reports"
 RELEASE_SUMMARY = WORKSPACE / "docs" / "release-summary.json"
 SUMMARY_MD = REPORT_ROOT / "daily-summary.md"
 SUMMARY_JSON = REPORT_ROOT / "daily-summary.json"
+BINARY_SUFFIXES = (".ipa", ".apk", ".aab")
+SUCCESS_STATUSES = frozenset({"passed", "completed", "success"})
+SIZE_UNITS = ("KB", "MB", "GB", "TB", "PB")
+# shared read-only default for .get() chains; never mutate
+EMPTY: dict[str, Any] = {}
 
 
 def load_json(path: Path) -> dict[str, Any]:
-    if not path.exists():
-        return {}
+    # report_cache keys on path + mtime, so release-summary.json is parsed once for both platforms
     try:
-        return json.loads(path.read_text(encoding="utf-8"))
-    except json.JSONDecodeError:
+        return report_cache.load(path)
+    except FileNotFoundError:
+        return {}
+    except orjson.JSONDecodeError:
         console.print(f"[yellow]Unable to parse JSON from {path}")
         return {}
 
 
+def load_reports(report_dir: Path, names: tuple[str, ...]) -> list[dict[str, Any]]:
+    # one directory listing instead of a failed stat per report when a platform wasn't run
+    try:
+        present = set(os.listdir(report_dir))
+    except FileNotFoundError:
+        present = set()
+    paths = [report_dir / name if name in present else None for name in names]
+    return [load_json(path) if path is not None else {} for path in paths]
+
+
+def read_git_head() -> str | None:
+    # resolve HEAD from the files git itself reads, avoiding a git subprocess per run
+    git_dir = WORKSPACE / ".git"
+    try:
+        head = (git_dir / "HEAD").read_text(encoding="utf-8").strip()
+    except OSError:
+        return None
+    if not head.startswith("ref: "):
+        return head or None
+    ref = head[len("ref: "):]
+    try:
+        return (git_dir / ref).read_text(encoding="utf-8").strip() or None
+    except OSError:
+        pass
+    try:
+        with (git_dir / "packed-refs").open("r", encoding="utf-8") as fh:
+            for line in fh:
+                sha, _, name = line.rstrip("\n").partition(" ")
+                if name == ref:
+                    return sha
+    except OSError:
+        pass
+    return None
+
+
 def git_commit() -> str:
     env_commit = os.getenv("GITHUB_SHA") or os.getenv("CI_COMMIT_SHA")
     if env_commit:
         return env_commit
+    head = read_git_head()
+    if head:
+        return head
     try:
         result = subprocess.check_output(["git", "rev-parse", "HEAD"], cwd=WORKSPACE)
         return result.decode("utf-8").strip()
@@ -47,49 +96,74 @@ def locate_latest_binary(platform: str) -> str | None:
     if not binary_dir.exists():
         return None
 
-    candidates: list[Path] = []
-    for pattern in ("*.ipa", "*.apk", "*.aab"):
-        candidates.extend(binary_dir.rglob(pattern))
-
-    if not candidates:
+    # one walk, tracking the newest candidate instead of sorting them all
+    latest_path: str | None = None
+    latest_mtime = 0.0
+    for entry in iter_files(str(binary_dir)):
+        if not entry.name.endswith(BINARY_SUFFIXES):
+            continue
+        mtime = entry.stat().st_mtime
+        if latest_path is None or mtime > latest_mtime:
+            latest_path, latest_mtime = entry.path, mtime
+
+    if latest_path is None:
         # fall back to most recent directory name for visibility
-        latest_dir = sorted(binary_dir.glob("*"), key=lambda p: p.stat().st_mtime, reverse=True)
-        return latest_dir[0].name if latest_dir else None
+        with os.scandir(binary_dir) as entries:
+            latest_dir = max(entries, key=lambda entry: entry.stat().st_mtime, default=None)
+        return latest_dir.name if latest_dir else None
 
-    candidates.sort(key=lambda p: p.stat().st_mtime, reverse=True)
-    return str(candidates[0].relative_to(WORKSPACE))
+    return str(Path(latest_path).relative_to(WORKSPACE))
 
 
 def summarise_flows(ui_summary: dict[str, Any]) -> dict[str, Any]:
     flows = ui_summary.get("flows", []) if isinstance(ui_summary, dict) else []
-    total = len(flows)
-    succeeded = sum(1 for flow in flows if flow.get("status") in {"passed", "completed", "success"})
-    failed = [flow for flow in flows if flow.get("status") not in {"passed", "completed", "success"}]
-    return {
-        "total": total,
-        "succeeded": succeeded,
-        "failed": [
-            {
+    succeeded = 0
+    failed = []
+    for flow in flows:
+        status = flow.get("status")
+        if status in SUCCESS_STATUSES:
+            succeeded += 1
+        else:
+            failed.append({
                 "name": flow.get("name") or flow.get("slug") or "unknown",
-                "status": flow.get("status"),
+                "status": status,
                 "error": flow.get("error"),
-            }
-            for flow in failed
-        ],
+            })
+    return {
+        "total": len(flows),
+        "succeeded": succeeded,
+        "failed": failed,
     }
 
 
 def summarise_platform(platform: str) -> dict[str, Any]:
     report_dir = REPORT_ROOT / platform
-    ui_summary = load_json(report_dir / "ui-run.json")
-    network_summary = load_json(report_dir / "network-summary.json")
-    assets_summary = load_json(report_dir / "assets-summary.json")
-    diff_summary = load_json(report_dir / "diff-summary.json")
-    release_data = load_json(RELEASE_SUMMARY).get("platforms", {}).get(platform, {})
+    ui_summary, network_summary, assets_summary, diff_summary = load_reports(
+        report_dir, ("ui-run.json", "network-summary.json", "assets-summary.json", "diff-summary.json")
+    )
+    release_data = load_json(RELEASE_SUMMARY).get("platforms", EMPTY).get(platform, EMPTY)
+
+    if not (ui_summary or network_summary or assets_summary or diff_summary):
+        # platform skipped in this run: same shape the full path yields for empty reports
+        return {
+            "platform": platform,
+            "run_id": release_data.get("run_id") or None,
+            "binary": locate_latest_binary(platform),
+            "flows": {"total": 0, "succeeded": 0, "failed": []},
+            "network": {"endpoint_count": 0, "notable_additions": [], "notable_removals": []},
+            "assets": {"files": None, "bytes": None, "changed_categories": []},
+            "tokens": {"screens": None, "added": [], "removed": []},
+            "risk": {},
+            "note": "No capture data available",
+        }
 
     endpoints = network_summary.get("endpoints", {}) if isinstance(network_summary, dict) else {}
     assets_totals = assets_summary.get("totals", {}) if isinstance(assets_summary, dict) else {}
     diff_risk = diff_summary.get("risk", {}) if isinstance(diff_summary, dict) else {}
+    # look each diff section up once; [:5] already copies at most five references
+    network_diff = diff_summary.get("network", EMPTY)
+    assets_diff = diff_summary.get("assets", EMPTY)
+    tokens_diff = diff_summary.get("tokens", EMPTY)
 
     summary = {
         "platform": platform,
@@ -98,18 +172,18 @@ def summarise_platform(platform: str) -> dict[str, Any]:
         "flows": summarise_flows(ui_summary),
         "network": {
             "endpoint_count": len(endpoints),
-            "notable_additions": [item.get("endpoint") for item in diff_summary.get("network", {}).get("added", [])[:5]],
-            "notable_removals": [item.get("endpoint") for item in diff_summary.get("network", {}).get("removed", [])[:5]],
+            "notable_additions": [item.get("endpoint") for item in network_diff.get("added", [])[:5]],
+            "notable_removals": [item.get("endpoint") for item in network_diff.get("removed", [])[:5]],
         },
         "assets": {
             "files": assets_totals.get("files"),
             "bytes": assets_totals.get("bytes"),
-            "changed_categories": [item.get("category") for item in diff_summary.get("assets", {}).get("changed", [])[:5]],
+            "changed_categories": [item.get("category") for item in assets_diff.get("changed", [])[:5]],
         },
         "tokens": {
-            "screens": diff_summary.get("tokens", {}).get("totals", {}).get("current"),
-            "added": diff_summary.get("tokens", {}).get("added", [])[:5],
-            "removed": diff_summary.get("tokens", {}).get("removed", [])[:5],
+            "screens": tokens_diff.get("totals", EMPTY).get("current"),
+            "added": tokens_diff.get("added", [])[:5],
+            "removed": tokens_diff.get("removed", [])[:5],
         },
         "risk": diff_risk,
     }
@@ -123,85 +197,73 @@ def format_size(num: int | None) -> str:
         return "0"
     if num < 1024:
         return f"{num} B"
-    units = ["KB", "MB", "GB", "TB"]
-    value = float(num)
-    for unit in units:
-        value /= 1024
-        if value < 1024:
-            return f"{value:.2f} {unit}"
-    return f"{value:.2f} PB"
+    # every 10 bits is one 1024x unit step, so the unit falls out of the bit length
+    index = min((int(num).bit_length() - 1) // 10, len(SIZE_UNITS))
+    return f"{num / (1 << (index * 10)):.2f} {SIZE_UNITS[index - 1]}"
 
 
 def render_markdown(metadata: dict[str, Any], platforms: list[dict[str, Any]]) -> str:
-    lines = ["# Daily Automation Summary", ""]
-    lines.append(f"- Generated at: {metadata['generated_at']}")
-    lines.append(f"- Commit: `{metadata['commit']}`")
+    buf = io.StringIO()
+    buf.write("# Daily Automation Summary\n\n")
+    buf.write(f"- Generated at: {metadata['generated_at']}\n")
+    buf.write(f"- Commit: `{metadata['commit']}`\n")
     if metadata.get("run_id"):
-        lines.append(f"- Run ID: {metadata['run_id']}")
+        buf.write(f"- Run ID: {metadata['run_id']}\n")
     if metadata.get("tool_versions"):
         versions = ", ".join(f"{k}: {v}" for k, v in metadata["tool_versions"].items())
-        lines.append(f"- Tooling: {versions}")
-    lines.append("")
+        buf.write(f"- Tooling: {versions}\n")
+    buf.write("\n")
 
     if not platforms:
-        lines.append("No platform reports available.")
-        return "\n".join(lines) + "\n"
+        buf.write("No platform reports available.\n")
+        return buf.getvalue()
 
     for platform in platforms:
-        lines.append(f"## {platform['platform'].upper()}")
-        lines.append("")
+        buf.write(f"## {platform['platform'].upper()}\n\n")
         if platform.get("run_id"):
-            lines.append(f"- Run ID: `{platform['run_id']}`")
+            buf.write(f"- Run ID: `{platform['run_id']}`\n")
         if platform.get("binary"):
-            lines.append(f"- Latest binary: {platform['binary']}")
+            buf.write(f"- Latest binary: {platform['binary']}\n")
         flow_stats = platform.get("flows", {})
-        lines.append(
-            f"- Flows: {flow_stats.get('succeeded', 0)}/{flow_stats.get('total', 0)} passed"
-        )
+        buf.write(f"- Flows: {flow_stats.get('succeeded', 0)}/{flow_stats.get('total', 0)} passed\n")
         failed = flow_stats.get("failed", [])
         if failed:
-            lines.append("  - ❌ Failures:")
+            buf.write("  - ❌ Failures:\n")
             for flow in failed:
                 name = flow.get("name") or "unknown"
                 status = flow.get("status") or "failure"
-                lines.append(f"    - {name} ({status})")
+                buf.write(f"    - {name} ({status})\n")
         network = platform.get("network", {})
-        lines.append(f"- Network endpoints captured: {network.get('endpoint_count', 0)}")
+        buf.write(f"- Network endpoints captured: {network.get('endpoint_count', 0)}\n")
         additions = [item for item in network.get("notable_additions", []) if item]
         removals = [item for item in network.get("notable_removals", []) if item]
         if additions:
-            lines.append("  - ➕ New endpoints:")
+            buf.write("  - ➕ New endpoints:\n")
             for endpoint in additions:
-                lines.append(f"    - {endpoint}")
+                buf.write(f"    - {endpoint}\n")
         if removals:
-            lines.append("  - ➖ Removed endpoints:")
+            buf.write("  - ➖ Removed endpoints:\n")
             for endpoint in removals:
-                lines.append(f"    - {endpoint}")
+                buf.write(f"    - {endpoint}\n")
         assets = platform.get("assets", {})
-        lines.append(
-            f"- Assets mirrored: {assets.get('files', 0)} files ({format_size(assets.get('bytes'))})"
-        )
+        buf.write(f"- Assets mirrored: {assets.get('files', 0)} files ({format_size(assets.get('bytes'))})\n")
         if assets.get("changed_categories"):
-            lines.append("  - ∆ Categories: " + ", ".join(assets["changed_categories"]))
+            buf.write("  - ∆ Categories: " + ", ".join(assets["changed_categories"]) + "\n")
         tokens = platform.get("tokens", {})
         if tokens.get("screens") is not None:
-            lines.append(
-                f"- Design tokens: {tokens.get('screens', 0)} screens tracked"
-            )
+            buf.write(f"- Design tokens: {tokens.get('screens', 0)} screens tracked\n")
         if tokens.get("added"):
-            lines.append("  - ➕ Screens: " + ", ".join(tokens["added"]))
+            buf.write("  - ➕ Screens: " + ", ".join(tokens["added"]) + "\n")
         if tokens.get("removed"):
-            lines.append("  - ➖ Screens: " + ", ".join(tokens["removed"]))
+            buf.write("  - ➖ Screens: " + ", ".join(tokens["removed"]) + "\n")
         risk = platform.get("risk", {})
         if risk:
-            lines.append(
-                f"- Risk level: {risk.get('label', 'unknown')} (score {risk.get('score', 0)})"
-            )
+            buf.write(f"- Risk level: {risk.get('label', 'unknown')} (score {risk.get('score', 0)})\n")
         if platform.get("note"):
-            lines.append(f"- Note: {platform['note']}")
-        lines.append("")
+            buf.write(f"- Note: {platform['note']}\n")
+        buf.write("\n")
 
-    return "\n".join(lines).rstrip() + "\n"
+    return buf.getvalue().rstrip() + "\n"
 
 
 def gather_metadata() -> dict[str, Any]:
@@ -222,7 +284,7 @@ def gather_metadata() -> dict[str, Any]:
     return metadata
 
 
-def main() -> None:
+def main(argv: list[str] | None = None) -> None:
     parser = argparse.ArgumentParser(description="Aggregate reports into a summary")
     parser.add_argument(
         "--platforms",
@@ -240,18 +302,24 @@ def main() -> None:
         type=Path,
         help="Optional JSON output location.",
     )
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
 
     platforms_to_process = args.platforms
     if not platforms_to_process:
         platforms_to_process = [p for p in ("ios", "android") if (REPORT_ROOT / p).exists()]
 
     summaries = []
-    for platform in platforms_to_process:
-        summary = summarise_platform(platform)
+    if platforms_to_process:
+        # warm the shared release summary so the workers don't both miss the cache and parse it
+        load_json(RELEASE_SUMMARY)
+        # platforms only read their own reports and binaries, so their I/O can overlap
+        with ThreadPoolExecutor(max_workers=len(platforms_to_process)) as executor:
+            summaries = list(executor.map(summarise_platform, platforms_to_process))
+    for summary in summaries:
         if summary["flows"]["total"] == 0 and summary["network"]["endpoint_count"] == 0:
-            console.print(f"[yellow]No capture artefacts detected for {platform}; including placeholder summary")
-        summaries.append(summary)
+            console.print(
+                f"[yellow]No capture artefacts detected for {summary['platform']}; including placeholder summary"
+            )
 
     metadata = gather_metadata()
     markdown = render_markdown(metadata, summaries)
@@ -266,7 +334,7 @@ def main() -> None:
     }
     json_path = args.json_output or SUMMARY_JSON
     json_path.parent.mkdir(parents=True, exist_ok=True)
-    json_path.write_text(json.dumps(json_payload, indent=2), encoding="utf-8")
+    json_path.write_bytes(orjson.dumps(json_payload, option=orjson.OPT_INDENT_2))
     console.print(f"Wrote JSON summary to {json_path}")
 
 
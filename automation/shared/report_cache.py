@@ -0,0 +1,32 @@
+#!/usr/bin/env python3
+"""Run-scoped cache of parsed report JSON shared by the QA and reporting scripts."""
+from __future__ import annotations
+
+import functools
+import os
+from pathlib import Path
+from typing import Any
+
+import orjson
+
+WORKSPACE = Path(__file__).resolve().parents[2]
+REPORT_ROOT = WORKSPACE / "reports"
+
+
+@functools.lru_cache(maxsize=None)
+def read_json_cached(path_str: str, mtime_ns: int) -> Any:
+    # mtime_ns is part of the cache key so files rewritten mid-run are re-read
+    return orjson.loads(Path(path_str).read_bytes())
+
+
+def load(path: Path, st: os.stat_result | None = None) -> Any:
+    # raises FileNotFoundError / orjson.JSONDecodeError like a direct read would;
+    # callers share the parsed object, so it must be treated as read-only.
+    # Pass st when the caller has already stat()ed the path.
+    if st is None:
+        st = path.stat()
+    return read_json_cached(str(path), st.st_mtime_ns)
+
+
+def get(platform: str, name: str) -> Any:
+    return load(REPORT_ROOT / platform / name)
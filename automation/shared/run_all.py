@@ -0,0 +1,45 @@
+#!/usr/bin/env python3
+"""Run QA checks, the release report, and the diff suite in one process.
+
+Running them together lets all three share the parsed reports in report_cache
+instead of each script re-reading and re-parsing the same JSON files. With
+--aggregate the daily summary and cross-platform parity report follow in the
+same process.
+"""
+from __future__ import annotations
+
+import argparse
+
+import cross_platform_diff
+import diff_suite
+import qa_check
+import release_report
+import report_aggregator
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Run QA, release report, and diff suite")
+    parser.add_argument("platform", choices=["ios", "android", "both"], help="Platform to process")
+    parser.add_argument(
+        "--store-baseline",
+        action="store_true",
+        help="Copy current summaries to *.prev.json after diff completes",
+    )
+    parser.add_argument(
+        "--aggregate",
+        action="store_true",
+        help="Also run report_aggregator and cross_platform_diff afterwards",
+    )
+    args = parser.parse_args()
+
+    qa_check.main([args.platform])
+    release_report.main([args.platform])
+    diff_suite.main([args.platform] + (["--store-baseline"] if args.store_baseline else []))
+    if args.aggregate:
+        platforms = ["ios", "android"] if args.platform == "both" else [args.platform]
+        report_aggregator.main(["--platforms", *platforms])
+        cross_platform_diff.main([])
+
+
+if __name__ == "__main__":
+    main()
@@ -20,13 +20,16 @@ from automation.shared.archive_binary import archive as archive_binary
 
 console = Console()
 
+# libyaml's C loader when PyYAML was built with it, otherwise the pure-Python one
+YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
 
 def load_config(path: Path) -> dict:
     if not path.exists():
         console.print(f"[bold red]Missing config file: {path}")
         sys.exit(1)
     with path.open("r", encoding="utf-8") as fh:
-        data = yaml.safe_load(fh)
+        data = yaml.load(fh, Loader=YAML_LOADER)
     return data
 
 
@@ -55,6 +58,25 @@ def android_capture(config: dict, workspace: Path) -> None:
     run([str(script), str(workspace)], cwd=workspace)
 
 
+def run_wave(steps: list[tuple[list[str], Path]], serial: bool = False) -> None:
+    # steps within a wave read and write disjoint artefacts, so they can run side by side
+    if serial or len(steps) < 2:
+        for cmd, cwd in steps:
+            run(cmd, cwd=cwd)
+        return
+    processes = []
+    for cmd, cwd in steps:
+        console.log("$ " + " ".join(cmd))
+        processes.append((cmd, subprocess.Popen(cmd, cwd=cwd)))
+    # wait for every process before raising so none are left running unattended
+    failed: subprocess.CalledProcessError | None = None
+    for cmd, process in processes:
+        if process.wait() != 0 and failed is None:
+            failed = subprocess.CalledProcessError(process.returncode, cmd)
+    if failed:
+        raise failed
+
+
 def generate_specs(workspace: Path) -> None:
     run(["python3", ".automation/scripts/shared/generate_specs.py"], cwd=workspace)
 
@@ -67,30 +89,30 @@ def install_node_packages(platform: str, workspace: Path) -> None:
     run(["npm", "install"], cwd=package_dir)
 
 
-def generate_design_tokens(platform: str, workspace: Path) -> None:
+def design_tokens_step(platform: str, workspace: Path) -> tuple[list[str], Path] | None:
     script_dir = workspace / "automation" / platform
     script = script_dir / "generate_tokens.ts"
     if not script.exists():
         console.print(f"[yellow]Token generator missing for {platform}; skipping")
-        return
-    run(["npx", "ts-node", script.name], cwd=script_dir)
+        return None
+    return ["npx", "ts-node", script.name], script_dir
 
 
-def run_backend_sync(workspace: Path) -> None:
-    if not (workspace / "backend").exists():
+def run_backend_sync(workspace: Path, top_level: set[str]) -> None:
+    if "backend" not in top_level:
         console.print("[yellow]Backend directory missing; skipping sync tests")
         return
     run(["npm", "test"], cwd=workspace / "backend")
 
 
-def build_clients(workspace: Path) -> None:
+def build_clients(workspace: Path, top_level: set[str]) -> None:
     ios_dir = workspace / "client-ios"
     android_dir = workspace / "client-android"
-    if ios_dir.exists():
+    if "client-ios" in top_level:
         run(["fastlane", "clone_build"], cwd=ios_dir)
     else:
         console.print("[yellow]client-ios missing; skip")
-    if android_dir.exists():
+    if "client-android" in top_level:
         run(["./gradlew", "cloneBuild"], cwd=android_dir)
     else:
         console.print("[yellow]client-android missing; skip")
@@ -101,6 +123,11 @@ def main() -> None:
     parser.add_argument("platform", choices=["ios", "android"], help="Platform to process")
     parser.add_argument("binary", type=Path, help="Path to IPA or APK/AAB file")
     parser.add_argument("--config", default=os.getenv("AUTOMATION_CONFIG", ".automation/config.yaml"))
+    parser.add_argument(
+        "--serial",
+        action="store_true",
+        help="Run pipeline steps one at a time (easier to read logs when debugging)",
+    )
     args = parser.parse_args()
 
     workspace = Path(os.getcwd())
@@ -125,69 +152,30 @@ def main() -> None:
         else:
             android_capture(config, workspace)
 
-    summarize_network_cmd = [
-        "python3",
-        "automation/shared/summarize_network.py",
-        args.platform,
-    ]
-    run(summarize_network_cmd, cwd=workspace)
-
-    security_cmd = [
-        "python3",
-        "automation/shared/security_audit.py",
-        args.platform,
+    # wave 1 turns raw captures into reports, fixtures and design tokens
+    first_wave = [
+        (["python3", "automation/shared/summarize_network.py", args.platform], workspace),
+        (["python3", "automation/shared/security_audit.py", args.platform], workspace),
     ]
-    run(security_cmd, cwd=workspace)
-
-    run([
-        "python3",
-        "backend/src/sync_endpoints.py",
-        "--platforms",
-        args.platform,
-    ], cwd=workspace)
-
-    generate_design_tokens(args.platform, workspace)
-
-    run([
-        "python3",
-        "automation/shared/sync_tokens.py",
-        args.platform,
-    ], cwd=workspace)
-
-    run([
-        "python3",
-        "automation/shared/qa_check.py",
-        args.platform,
-    ], cwd=workspace)
-
-    run([
-        "python3",
-        "automation/shared/release_report.py",
-        args.platform,
-    ], cwd=workspace)
-
-    run([
-        "python3",
-        "automation/shared/diff_suite.py",
-        args.platform,
-        "--store-baseline",
-    ], cwd=workspace)
-
-    run([
-        "python3",
-        "automation/shared/report_aggregator.py",
-        "--platforms",
-        args.platform,
-    ], cwd=workspace)
-
-    run([
-        "python3",
-        "automation/shared/cross_platform_diff.py",
-    ], cwd=workspace)
+    tokens_step = design_tokens_step(args.platform, workspace)
+    if tokens_step:
+        first_wave.append(tokens_step)
+    run_wave(first_wave, serial=args.serial)
+
+    # wave 2 consumes those outputs; run_all runs qa_check, release_report, diff_suite,
+    # report_aggregator and cross_platform_diff in one interpreter so they share parsed reports
+    run_wave([
+        (["python3", "backend/src/sync_endpoints.py", "--platforms", args.platform], workspace),
+        (["python3", "automation/shared/sync_tokens.py", args.platform], workspace),
+        (["python3", "automation/shared/run_all.py", args.platform, "--store-baseline", "--aggregate"], workspace),
+    ], serial=args.serial)
 
     generate_specs(workspace)
-    run_backend_sync(workspace)
-    build_clients(workspace)
+    # one listing answers the backend/client checks; taken late because sync_tokens
+    # can create the client directories
+    top_level = {entry.name for entry in os.scandir(workspace) if entry.is_dir()}
+    run_backend_sync(workspace, top_level)
+    build_clients(workspace, top_level)
 
     table = Table(title="Pipeline Complete")
     table.add_column("Platform")
@@ -3,22 +3,37 @@
 from __future__ import annotations
 
 import argparse
-import json
+import os
 import re
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
 from pathlib import Path
 
+import orjson
 from rich.console import Console
 from rich.table import Table
 
+from fs_walk import iter_files
+
 console = Console()
 
+# bytes patterns: files are scanned undecoded, every pattern is ASCII
 SECRET_PATTERNS = {
-    "AWS Access Key": re.compile(r"AKIA[0-9A-Z]{16}"),
-    "Google API Key": re.compile(r"AIza[0-9A-Za-z-_]{35}"),
-    "Private Key": re.compile(r"-----BEGIN (RSA|DSA|EC) PRIVATE KEY-----"),
-    "JWT": re.compile(r"eyJ[A-Za-z0-9_-]+\.[A-Za-z0-9_-]+\.[A-Za-z0-9_-]+"),
+    "AWS Access Key": re.compile(rb"AKIA[0-9A-Z]{16}"),
+    "Google API Key": re.compile(rb"AIza[0-9A-Za-z-_]{35}"),
+    "Private Key": re.compile(rb"-----BEGIN (RSA|DSA|EC) PRIVATE KEY-----"),
+    "JWT": re.compile(rb"eyJ[A-Za-z0-9_-]+\.[A-Za-z0-9_-]+\.[A-Za-z0-9_-]+"),
 }
 
+# bound finditer plus the group findall() used to report, resolved once per process
+SECRET_FINDERS = [
+    (name, pattern.finditer, 1 if pattern.groups else 0) for name, pattern in SECRET_PATTERNS.items()
+]
+
+MAX_MATCHES = 5
+# below this many files, process start-up costs more than the scan itself
+PARALLEL_SCAN_MIN_FILES = 64
+
 PII_KEYWORDS = [
     "ssn",
     "social security",
@@ -28,41 +43,67 @@ PII_KEYWORDS = [
     "private",
 ]
 
-CONFIG_FILENAMES = {
-    "plist": re.compile(r"\.plist$", re.IGNORECASE),
-    "json": re.compile(r"\.json$", re.IGNORECASE),
-    "xml": re.compile(r"\.xml$", re.IGNORECASE),
-    "strings": re.compile(r"\.strings$", re.IGNORECASE),
-}
+UNSCANNED_SUFFIXES = frozenset({
+    ".png", ".jpg", ".jpeg", ".gif", ".webp", ".heic", ".bmp", ".ico",
+    ".mp3", ".mp4", ".m4a", ".mov", ".wav", ".aac", ".ogg",
+    ".ttf", ".otf", ".woff", ".woff2",
+})
+
+PII_KEYWORD_BYTES = [(keyword, keyword.encode("ascii")) for keyword in PII_KEYWORDS]
+
+CONFIG_SUFFIXES = (".plist", ".json", ".xml", ".strings")
 
 
 def scan_file(path: Path) -> dict:
+    # scanning raw bytes skips the UTF-8 decode and keeps the lowered copy at one byte per char
     try:
-        text = path.read_text(encoding="utf-8", errors="ignore")
+        data = path.read_bytes()
     except Exception:  # noqa: BLE001
         return {}
 
     findings: dict[str, list[str]] = {}
 
-    for name, pattern in SECRET_PATTERNS.items():
-        matches = pattern.findall(text)
+    # one scan per pattern: each keeps re's literal-prefix search, which a combined
+    # alternation loses. Stop after the five matches that are reported.
+    for name, finditer, group in SECRET_FINDERS:
+        matches = [match.group(group).decode("ascii") for match in islice(finditer(data), MAX_MATCHES)]
         if matches:
-            findings.setdefault(name, []).extend(matches[:5])
+            findings.setdefault(name, []).extend(matches)
 
-    lowered = text.lower()
-    for keyword in PII_KEYWORDS:
-        if keyword in lowered:
+    lowered = data.lower()
+    for keyword, keyword_bytes in PII_KEYWORD_BYTES:
+        if keyword_bytes in lowered:
             findings.setdefault("PII keyword", []).append(keyword)
 
     return findings
 
 
-def summarize_asset_dir(asset_dir: Path) -> list[dict]:
+def walk_platform(platform_dir: Path, asset_dir: Path) -> tuple[list[Path], list[Path]]:
+    # one traversal feeds both the asset scan and the config inventory
+    asset_files: list[Path] = []
+    config_files: list[Path] = []
+    if not platform_dir.is_dir():
+        return asset_files, config_files
+    asset_prefix = str(asset_dir) + os.sep
+    for entry in iter_files(str(platform_dir)):
+        name = entry.name.lower()
+        if name.endswith(CONFIG_SUFFIXES):
+            config_files.append(Path(entry.path))
+        # media and fonts are compressed binary data; the patterns can't meaningfully match there
+        if entry.path.startswith(asset_prefix) and os.path.splitext(name)[1] not in UNSCANNED_SUFFIXES:
+            asset_files.append(Path(entry.path))
+    return asset_files, config_files
+
+
+def summarize_asset_files(asset_dir: Path, files: list[Path]) -> list[dict]:
     rows: list[dict] = []
-    for file in asset_dir.rglob("*"):
-        if not file.is_file():
-            continue
-        findings = scan_file(file)
+    if len(files) < PARALLEL_SCAN_MIN_FILES:
+        results = list(map(scan_file, files))
+    else:
+        # each file is scanned independently and regex matching holds the GIL, so fan out to processes
+        with ProcessPoolExecutor(max_workers=max(1, min(len(files), os.cpu_count() or 1))) as executor:
+            results = list(executor.map(scan_file, files, chunksize=32))
+    for file, findings in zip(files, results):
         if findings:
             rows.append({
                 "path": str(file.relative_to(asset_dir)),
@@ -71,32 +112,18 @@ def summarize_asset_dir(asset_dir: Path) -> list[dict]:
     return rows
 
 
-def find_config_files(base_dir: Path) -> list[Path]:
-    results: list[Path] = []
-    for file in base_dir.rglob("*"):
-        if not file.is_file():
-            continue
-        if any(pattern.search(file.name) for pattern in CONFIG_FILENAMES.values()):
-            results.append(file)
-    return results
-
-
 def audit_platform(platform: str, base: Path, report_dir: Path) -> dict:
     asset_dir = base / platform / "assets"
+    asset_files, config_files = walk_platform(base / platform, asset_dir)
     results = {
         "platform": platform,
-        "suspect_files": [],
-        "config_files": [],
+        "suspect_files": summarize_asset_files(asset_dir, asset_files),
+        "config_files": [str(path.relative_to(base)) for path in config_files],
     }
-    if asset_dir.exists():
-        results["suspect_files"] = summarize_asset_dir(asset_dir)
-
-    config_files = find_config_files(base / platform)
-    results["config_files"] = [str(path.relative_to(base)) for path in config_files]
 
     report_dir.mkdir(parents=True, exist_ok=True)
     output = report_dir / "security-audit.json"
-    output.write_text(json.dumps(results, indent=2), encoding="utf-8")
+    output.write_bytes(orjson.dumps(results, option=orjson.OPT_INDENT_2))
 
     table = Table(title=f"Security Audit ({platform})")
     table.add_column("Type")
@@ -3,14 +3,17 @@
 from __future__ import annotations
 
 import argparse
-import json
+import functools
 import os
 import subprocess
 import sys
 from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from urllib.parse import urlparse
+from typing import Iterator
+from urllib.parse import ParseResult, urlparse
 
+import orjson
 from rich.console import Console
 
 console = Console()
@@ -20,9 +23,11 @@ CAPTURE_ROOT = WORKSPACE / "captures"
 REPORT_ROOT = WORKSPACE / "reports"
 FIXTURE_ROOT = WORKSPACE / "fixtures" / "shared"
 MITM_SUMMARY_SCRIPT = WORKSPACE / "automation" / "shared" / "mitm_summary.py"
+# examples kept per endpoint, for brevity
+MAX_EXAMPLES = 5
 
 
-def run_mitm_summary(mitm_file: Path, output_json: Path) -> bool:
+def run_mitm_summary(mitm_file: Path, output_path: Path) -> bool:
     try:
         cmd = [
             "mitmdump",
@@ -31,33 +36,51 @@ def run_mitm_summary(mitm_file: Path, output_json: Path) -> bool:
             "-s",
             str(MITM_SUMMARY_SCRIPT),
             "--set",
-            f"summary_output={output_json}",
+            f"summary_output={output_path}",
+            # one record per line lets aggregate_summary stream instead of loading whole files
+            "--set",
+            "summary_ndjson=true",
         ]
         console.log("$ " + " ".join(cmd))
-        subprocess.run(cmd, check=True)
+        # output is captured so concurrent mitmdump runs don't interleave on the console
+        subprocess.run(cmd, check=True, capture_output=True, text=True)
         return True
     except FileNotFoundError:
         console.print("[bold red]mitmdump not available; install mitmproxy on capture host")
         return False
     except subprocess.CalledProcessError as err:
         console.print(f"[bold red]Failed to summarize {mitm_file}: {err}")
+        if err.stderr:
+            console.print(err.stderr.rstrip())
         return False
 
 
+@functools.lru_cache(maxsize=8192)
+def parse_url(url: str) -> ParseResult:
+    # captures repeat the same handful of URLs thousands of times; ParseResult is immutable
+    return urlparse(url)
+
+
+def iter_records(summary_file: Path) -> Iterator[dict]:
+    with summary_file.open("rb") as fh:
+        for line_number, line in enumerate(fh, 1):
+            if not line.strip():
+                continue
+            try:
+                yield orjson.loads(line)
+            except orjson.JSONDecodeError as err:
+                # e.g. the last line of a capture whose mitmdump run was cut short
+                console.print(f"[yellow]Skipping invalid record {summary_file}:{line_number}: {err}")
+
+
 def aggregate_summary(files: list[Path]) -> dict[str, dict]:
     endpoints: dict[str, dict] = {}
 
     for summary_file in files:
-        try:
-            data = json.loads(summary_file.read_text(encoding="utf-8"))
-        except json.JSONDecodeError as err:
-            console.print(f"[yellow]Skipping invalid JSON {summary_file}: {err}")
-            continue
-
-        for record in data:
+        for record in iter_records(summary_file):
             method = record.get("method", "GET")
             url = record.get("url", "")
-            parsed = urlparse(url)
+            parsed = parse_url(url)
             path = parsed.path or record.get("path") or "/"
             key = f"{method} {path}"
             entry = endpoints.setdefault(
@@ -80,16 +103,17 @@ def aggregate_summary(files: list[Path]) -> dict[str, dict]:
             if status is not None:
                 entry["status_codes"][status] += 1
 
-            example = {
-                "url": url,
-                "status_code": status,
-                "reason": record.get("reason"),
-                "request_headers": record.get("request_headers"),
-                "response_headers": record.get("response_headers"),
-                "request_body": record.get("request_body"),
-                "response_body": record.get("response_body"),
-            }
-            entry["examples"].append(example)
+            # only the first MAX_EXAMPLES are reported, so don't hold on to later bodies
+            if len(entry["examples"]) < MAX_EXAMPLES:
+                entry["examples"].append({
+                    "url": url,
+                    "status_code": status,
+                    "reason": record.get("reason"),
+                    "request_headers": record.get("request_headers"),
+                    "response_headers": record.get("response_headers"),
+                    "request_body": record.get("request_body"),
+                    "response_body": record.get("response_body"),
+                })
 
     # normalise sets and defaultdicts
     normalised: dict[str, dict] = {}
@@ -99,7 +123,7 @@ def aggregate_summary(files: list[Path]) -> dict[str, dict]:
             "path": entry["path"],
             "hosts": sorted(entry["hosts"]),
             "status_codes": dict(entry["status_codes"]),
-            "examples": entry["examples"][:5],  # limit examples for brevity
+            "examples": entry["examples"],
         }
     return normalised
 
@@ -130,7 +154,7 @@ def write_openapi(endpoints: dict[str, dict], output: Path) -> None:
         "paths": paths,
     }
     output.parent.mkdir(parents=True, exist_ok=True)
-    output.write_text(json.dumps(openapi_doc, indent=2), encoding="utf-8")
+    output.write_bytes(orjson.dumps(openapi_doc, option=orjson.OPT_INDENT_2))
 
 
 def summarise_platform(platform: str) -> None:
@@ -144,11 +168,12 @@ def summarise_platform(platform: str) -> None:
     per_flow_dir = report_dir / "network"
     per_flow_dir.mkdir(parents=True, exist_ok=True)
 
-    summary_files: list[Path] = []
-    for mitm_file in sorted(network_dir.glob("*.mitm")):
-        output_json = per_flow_dir / f"{mitm_file.stem}.json"
-        if run_mitm_summary(mitm_file, output_json):
-            summary_files.append(output_json)
+    mitm_files = sorted(network_dir.glob("*.mitm"))
+    output_paths = [per_flow_dir / f"{mitm_file.stem}.ndjson" for mitm_file in mitm_files]
+    # each mitmdump is its own process, so threads are enough to run them side by side
+    with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+        succeeded = list(executor.map(run_mitm_summary, mitm_files, output_paths))
+    summary_files = [path for path, ok in zip(output_paths, succeeded) if ok]
 
     if not summary_files:
         console.print(f"[yellow]No summaries generated for {platform}")
@@ -156,7 +181,10 @@ def summarise_platform(platform: str) -> None:
 
     aggregated = aggregate_summary(summary_files)
     summary_output = report_dir / "network-summary.json"
-    summary_output.write_text(json.dumps({"endpoints": aggregated}, indent=2), encoding="utf-8")
+    # status_codes is keyed by int status; OPT_NON_STR_KEYS writes them as strings like json did
+    summary_output.write_bytes(
+        orjson.dumps({"endpoints": aggregated}, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    )
     console.print(f"Wrote aggregated network summary to {summary_output}")
 
     openapi_output = FIXTURE_ROOT / f"api-{platform}.json"
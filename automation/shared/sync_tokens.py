@@ -20,7 +20,7 @@ def sync_ios() -> None:
         return
     resources_dir = WORKSPACE / "client-ios" / "Sources" / "CloneUI" / "Resources"
     resources_dir.mkdir(parents=True, exist_ok=True)
-    shutil.copy2(source, resources_dir / "tokens.json")
+    shutil.copyfile(source, resources_dir / "tokens.json")
     console.print(f"Copied iOS tokens to {resources_dir}")
 
 
@@ -31,7 +31,7 @@ def sync_android() -> None:
         return
     assets_dir = WORKSPACE / "client-android" / "app" / "src" / "main" / "assets"
     assets_dir.mkdir(parents=True, exist_ok=True)
-    shutil.copy2(source, assets_dir / "tokens.json")
+    shutil.copyfile(source, assets_dir / "tokens.json")
     console.print(f"Copied Android tokens to {assets_dir}")
 
 
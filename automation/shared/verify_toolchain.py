@@ -7,6 +7,7 @@ import platform
 import shutil
 import subprocess
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 from rich.console import Console
@@ -37,10 +38,21 @@ ANDROID_COMMANDS = [
     "java",
 ]
 
+# generous enough for JVM/emulator start-up, but stops one hung tool from stalling the check
+VERSION_TIMEOUT = 10
+
 
 def command_version(cmd: str) -> str | None:
     try:
-        result = subprocess.run([cmd, "--version"], check=False, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True)
+        result = subprocess.run(
+            [cmd, "--version"],
+            check=False,
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
+            text=True,
+            timeout=VERSION_TIMEOUT,
+        )
     except Exception:  # noqa: BLE001
         return None
     output = result.stdout.strip().splitlines()
@@ -55,11 +67,12 @@ def check_command(cmd: str) -> tuple[bool, str | None]:
 
 
 def verify(commands: list[str]) -> list[tuple[str, bool, str | None]]:
-    rows = []
-    for cmd in commands:
-        ok, version = check_command(cmd)
-        rows.append((cmd, ok, version))
-    return rows
+    if not commands:
+        return []
+    # each check mostly waits on a child process, so run them side by side; map keeps the order
+    with ThreadPoolExecutor(max_workers=min(16, len(commands))) as executor:
+        results = executor.map(check_command, commands)
+        return [(cmd, ok, version) for cmd, (ok, version) in zip(commands, results)]
 
 
 def main() -> None:
@@ -76,7 +89,8 @@ def main() -> None:
     if args.additional:
         commands.extend(args.additional)
 
-    rows = verify(commands)
+    # "both" lists appium twice; check each command once, keeping first-seen order
+    rows = verify(list(dict.fromkeys(commands)))
 
     table = Table(title=f"Toolchain Verification ({platform.system()})")
     table.add_column("Command")
@@ -4,8 +4,10 @@ from __future__ import annotations
 
 import argparse
 import json
+import re
 from pathlib import Path
 
+import orjson
 from rich.console import Console
 
 console = Console()
@@ -24,10 +26,10 @@ const router = express.Router();
 export default router;
 """
 
-HANDLER_TEMPLATE = """router.{method}("{path}", (req, res) => {{
-  res.status({status}).json({response});
-}});
-"""
+# shared read-only default for missing responses/examples
+EMPTY: dict = {}
+TODO_RESPONSE = json.dumps({"message": "TODO"})
+IMPORT_LINE = re.compile(r"^import.*$", re.MULTILINE)
 
 
 def load_openapi(platform: str) -> dict | None:
@@ -35,31 +37,41 @@ def load_openapi(platform: str) -> dict | None:
     if not path.exists():
         console.print(f"[yellow]OpenAPI skeleton missing for {platform}: {path}")
         return None
-    return json.loads(path.read_text(encoding="utf-8"))
+    return orjson.loads(path.read_bytes())
 
 
 def load_endpoint_examples(platform: str) -> dict:
     summary_path = REPORT_ROOT / platform / "network-summary.json"
     if not summary_path.exists():
         return {}
-    data = json.loads(summary_path.read_text(encoding="utf-8"))
+    data = orjson.loads(summary_path.read_bytes())
     return data.get("endpoints", {})
 
 
 def pick_response(example: dict) -> str:
     body = example.get("response_body") or "{}"
     try:
-        parsed = json.loads(body)
-        return json.dumps(parsed)
-    except json.JSONDecodeError:
+        orjson.loads(body)
+    except orjson.JSONDecodeError:
         return json.dumps({"body": body})
+    # valid JSON is also a valid JS expression, so the captured body is embedded as-is
+    return body
+
+
+def render_handler(method: str, path: str, status: int, response: str) -> str:
+    # an f-string skips str.format's per-call template parsing
+    return f"""router.{method}("{path}", (req, res) => {{
+  res.status({status}).json({response});
+}});
+"""
 
 
 def synthesize_handlers(platform: str, openapi: dict, endpoint_examples: dict) -> str:
     handlers: list[str] = []
-    for path, methods in openapi.get("paths", {}).items():
+    lookup_example = endpoint_examples.get
+    for path, methods in openapi.get("paths", EMPTY).items():
         for method, details in methods.items():
-            responses = details.get("responses", {})
+            responses = details.get("responses", EMPTY)
             try:
                 status = int(next(iter(responses)))
             except StopIteration:
@@ -67,22 +79,11 @@ def synthesize_handlers(platform: str, openapi: dict, endpoint_examples: dict) -
             except ValueError:
                 status = 200
             key = f"{method.upper()} {path}"
-            example = endpoint_examples.get(key, {})
-            example_body = None
+            example = lookup_example(key, EMPTY)
             examples = example.get("examples") if isinstance(example, dict) else None
-            if examples:
-                example_body = pick_response(examples[0])
-            else:
-                example_body = json.dumps({"message": "TODO"})
-
-            handlers.append(
-                HANDLER_TEMPLATE.format(
-                    method=method,
-                    path=path,
-                    status=status,
-                    response=example_body,
-                )
-            )
+            example_body = pick_response(examples[0]) if examples else TODO_RESPONSE
+
+            handlers.append(render_handler(method, path, status, example_body))
     return "\n".join(handlers)
 
 
@@ -95,29 +96,27 @@ def write_router(platform: str, handlers: str) -> None:
 def update_server(platforms: list[str]) -> None:
     server_path = BACKEND_SRC / "server.mjs"
     contents = server_path.read_text(encoding="utf-8")
-    marker = "// AUTO-ROUTERS" if "// AUTO-ROUTERS" in contents else None
-    if not marker:
+    if "// AUTO-ROUTERS" not in contents:
         contents = contents.replace(
             "app.use(express.json());",
             "app.use(express.json());\n\n// AUTO-ROUTERS\n",
             1,
         )
-        server_path.write_text(contents, encoding="utf-8")
-        contents = server_path.read_text(encoding="utf-8")
-
-    lines = contents.splitlines()
-    import_index = 0
-    for idx, line in enumerate(lines):
-        if line.startswith("import"):
-            import_index = idx
+
+    # new imports go after the last import line (or the first line if there are none)
+    insert_at = contents.find("\n")
+    if insert_at == -1:
+        insert_at = len(contents)
+    for match in IMPORT_LINE.finditer(contents):
+        insert_at = match.end()
     imports = []
     mounts = []
     for platform in platforms:
         router_name = f"{platform}Router"
-        imports.append(f"import {router_name} from './{platform}_router.mjs';")
+        imports.append(f"\nimport {router_name} from './{platform}_router.mjs';")
         mounts.append(f"app.use('/{platform}', {router_name});")
 
-    new_contents = "\n".join(lines[: import_index + 1] + imports + lines[import_index + 1 :])
+    new_contents = contents[:insert_at] + "".join(imports) + contents[insert_at:]
     new_contents = new_contents.replace(
         "// AUTO-ROUTERS",
         "// AUTO-ROUTERS\n" + "\n".join(mounts),